@@ -1,11 +1,27 @@
 """Roly package entrypoints."""
 
-from .cli import app
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typer import Typer
 
 
 def main() -> None:
     """Run the Roly command-line interface."""
-    app()
+    from .cli import run
+
+    run()
+
+
+def __getattr__(name: str) -> Typer:
+    """Resolve the Typer app lazily so importing roly stays cheap."""
+    if name == "app":
+        from .cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["app", "main"]
@@ -0,0 +1,669 @@
+"""Command implementations behind the Typer wiring in `roly.cli`."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from .context import AppContext
+from .errors import ConfigError, ReviewApplyError, RolyError
+from .models import SETUP_AGENTS, RoleDocument, RoleKind, RolyConfig
+from .paths import DEFAULT_OUTPUT_DIR, DEFAULT_PROJECT_ROLES_DIR, config_path
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+
+def _optional_config(
+    app_ctx: AppContext, explicit_config: Path | None = None
+) -> RolyConfig | None:
+    """Load config if path exists; otherwise return None."""
+    from .config import load_config_cached
+
+    if explicit_config is not None:
+        if not os.path.isfile(explicit_config):
+            raise ConfigError(f"Config not found: {explicit_config}")
+        candidate = explicit_config
+    else:
+        candidate = config_path(app_ctx.project_root)
+        if not os.path.isfile(candidate):
+            return None
+
+    return load_config_cached(candidate)
+
+
+def _config_or_default(app_ctx: AppContext) -> RolyConfig:
+    """Return loaded config or defaults if absent."""
+    cfg = _optional_config(app_ctx)
+    if cfg is not None:
+        return cfg
+    return RolyConfig(version=1)
+
+
+def _project_roles_dir(
+    app_ctx: AppContext, *, explicit_config: Path | None = None
+) -> tuple[RolyConfig | None, str]:
+    """Return the optional config and the project roles dir it selects."""
+    cfg = _optional_config(app_ctx, explicit_config)
+    if cfg is None:
+        return None, DEFAULT_PROJECT_ROLES_DIR
+    return cfg, cfg.paths.project_roles_dir
+
+
+def _confirm(app_ctx: AppContext, question: str, *, default: bool = True) -> bool:
+    """Ask a yes/no question, importing Rich prompts only when one is shown."""
+    from rich.prompt import Confirm
+
+    return Confirm.ask(question, default=default, console=app_ctx.console)
+
+
+def _handle_error(app_ctx: AppContext, error: Exception) -> None:
+    """Print user-facing error and exit."""
+    app_ctx.console.print(f"Error: {error}")
+    raise typer.Exit(code=1) from error
+
+
+def _resolve_role_chain(
+    *,
+    app_ctx: AppContext,
+    role_slugs: list[str],
+    project_roles_dir: str,
+) -> tuple[RoleDocument, list[RoleDocument]]:
+    """Resolve ordered role chain and inject dependent top-level role as needed."""
+    from .role_store import infer_role_kind, resolve_role
+
+    if not role_slugs:
+        raise ConfigError("At least one role slug is required")
+
+    def infer_kind(slug: str) -> RoleKind:
+        """Infer a requested slug's kind against the configured scopes."""
+        return infer_role_kind(
+            slug=slug,
+            project_root=app_ctx.project_root,
+            user_home=app_ctx.user_home,
+            project_roles_dir=project_roles_dir,
+        )
+
+    first_kind = infer_kind(role_slugs[0])
+    if first_kind is RoleKind.TOP_LEVEL and len(set(role_slugs)) == 1:
+        # A lone top-level role has no dependencies to reconcile.
+        lone_role = resolve_role(
+            kind=first_kind,
+            slug=role_slugs[0],
+            project_root=app_ctx.project_root,
+            user_home=app_ctx.user_home,
+            project_roles_dir=project_roles_dir,
+        )
+        return lone_role, []
+
+    resolved: dict[tuple[RoleKind, str], RoleDocument] = {}
+
+    def resolve_cached(kind: RoleKind, slug: str) -> RoleDocument:
+        """Resolve each (kind, slug) pair at most once per chain."""
+        role_doc = resolved.get((kind, slug))
+        if role_doc is None:
+            role_doc = resolve_role(
+                kind=kind,
+                slug=slug,
+                project_root=app_ctx.project_root,
+                user_home=app_ctx.user_home,
+                project_roles_dir=project_roles_dir,
+            )
+            resolved[(kind, slug)] = role_doc
+        return role_doc
+
+    top_role: RoleDocument | None = None
+    selected_sub_roles: dict[str, RoleDocument] = {}
+
+    for slug in dict.fromkeys(role_slugs):
+        kind = first_kind if slug == role_slugs[0] else infer_kind(slug)
+        role_doc = resolve_cached(kind, slug)
+
+        if kind is RoleKind.TOP_LEVEL:
+            if top_role is None:
+                top_role = role_doc
+            elif top_role.slug != role_doc.slug:
+                raise ConfigError(
+                    "Resolved roles include multiple top-level roles; choose one compatible set"
+                )
+            continue
+
+        dependency_slug = role_doc.depends_on_top_level
+        if dependency_slug is None:
+            raise ConfigError(
+                f"Sub-role '{role_doc.slug}' is missing dependency metadata"
+            )
+        dependency_doc = resolve_cached(RoleKind.TOP_LEVEL, dependency_slug)
+        if top_role is None:
+            top_role = dependency_doc
+        elif top_role.slug != dependency_doc.slug:
+            raise ConfigError(
+                "Resolved roles require conflicting top-level dependencies; cannot assemble"
+            )
+
+        selected_sub_roles.setdefault(role_doc.slug, role_doc)
+
+    if top_role is None:
+        raise ConfigError("Could not resolve a top-level role from requested roles")
+    return top_role, list(selected_sub_roles.values())
+
+
+def _resolve_role_target(
+    *,
+    app_ctx: AppContext,
+    role: str | None,
+    role_path: Path | None,
+    project_roles_dir: str,
+    for_promote: bool,
+) -> tuple[RoleKind, str]:
+    """Resolve target role kind and slug from slug or explicit role file path."""
+    from .role_store import infer_project_role_kind, infer_role_kind, role_from_path
+
+    if role is None and role_path is None:
+        raise ConfigError("Provide --role or --role-path")
+    if role is not None and role_path is not None:
+        raise ConfigError("Provide either --role or --role-path, not both")
+
+    if role_path is not None:
+        parsed = role_from_path(role_path, scope="project")
+        return parsed.kind, parsed.slug
+
+    if role is None:
+        raise ConfigError("Provide --role when --role-path is not set")
+    if for_promote:
+        kind = infer_project_role_kind(
+            slug=role,
+            project_root=app_ctx.project_root,
+            project_roles_dir=project_roles_dir,
+        )
+    else:
+        kind = infer_role_kind(
+            slug=role,
+            project_root=app_ctx.project_root,
+            user_home=app_ctx.user_home,
+            project_roles_dir=project_roles_dir,
+        )
+    return kind, role
+
+
+def run_list(app_ctx: AppContext, *, scope: str, kind: str) -> None:
+    """List available roles across builtin/user/project scopes."""
+    from .role_store import list_roles
+    from .ui import print_roles_table
+
+    try:
+        project_roles_dir = DEFAULT_PROJECT_ROLES_DIR
+        if scope in {"all", "project"}:
+            # Only project-scope lookups depend on the configured roles dir.
+            _, project_roles_dir = _project_roles_dir(app_ctx)
+        roles = list_roles(
+            project_root=app_ctx.project_root,
+            user_home=app_ctx.user_home,
+            project_roles_dir=project_roles_dir,
+            scope_filter=scope,
+            kind_filter=kind,
+        )
+        print_roles_table(app_ctx.console, roles)
+    except RolyError as error:
+        _handle_error(app_ctx, error)
+
+
+def run_setup(
+    app_ctx: AppContext,
+    *,
+    agent: str | None,
+    skill_dir: Path | None,
+    codex_dir: Path | None,
+    roly_home: Path | None,
+    force: bool,
+    yes: bool,
+) -> None:
+    """Install/update review skill and persist setup defaults."""
+    from rich.panel import Panel
+
+    from .config import write_config
+    from .setup import (
+        default_none_skill_path,
+        install_codex_skill,
+        install_none_prompt,
+        merged_setup_config,
+        resolve_codex_skills_dir,
+    )
+
+    if skill_dir is not None:
+        # Explicit --skill-dir values are relative to the working directory.
+        skill_dir = skill_dir.expanduser().resolve()
+
+    try:
+        cfg = _config_or_default(app_ctx)
+        setup_cfg = cfg.setup
+        interactive = (
+            agent is None
+            and skill_dir is None
+            and codex_dir is None
+            and roly_home is None
+            and not force
+            and not yes
+        )
+
+        chosen_agent = (
+            agent
+            if agent is not None
+            else (setup_cfg.agent if not interactive else None)
+        )
+        chosen_skill_dir = skill_dir
+        chosen_codex_dir = codex_dir
+        chosen_roly_home = roly_home
+
+        if interactive:
+            from rich.prompt import Prompt
+
+            chosen_agent = Prompt.ask(
+                "Agent target",
+                choices=list(SETUP_AGENTS),
+                default=setup_cfg.agent,
+                console=app_ctx.console,
+            )
+            if chosen_agent == "none":
+                default_path = setup_cfg.skill_dir or str(
+                    default_none_skill_path(app_ctx.project_root)
+                )
+                chosen_skill_dir = Path(
+                    Prompt.ask(
+                        "Portable prompt path",
+                        default=default_path,
+                        console=app_ctx.console,
+                    )
+                )
+            else:
+                default_codex = setup_cfg.codex_dir or str(
+                    resolve_codex_skills_dir(None)
+                )
+                chosen_codex_dir = Path(
+                    Prompt.ask(
+                        "Codex skills root",
+                        default=default_codex,
+                        console=app_ctx.console,
+                    )
+                )
+            if setup_cfg.roly_home:
+                chosen_roly_home = Path(
+                    Prompt.ask(
+                        "Roly home override",
+                        default=setup_cfg.roly_home,
+                        console=app_ctx.console,
+                    )
+                )
+            if not _confirm(app_ctx, "Apply setup changes?"):
+                app_ctx.console.print("Setup cancelled.")
+                return
+
+        if chosen_agent is None:
+            chosen_agent = "none"
+
+        if chosen_agent == "none":
+            result = install_none_prompt(
+                project_root=app_ctx.project_root,
+                skill_dir=chosen_skill_dir,
+                force=force,
+            )
+        else:
+            result = install_codex_skill(codex_dir=chosen_codex_dir, force=force)
+
+        persisted_setup = merged_setup_config(
+            existing=setup_cfg,
+            agent=chosen_agent,
+            skill_dir=chosen_skill_dir,
+            codex_dir=chosen_codex_dir,
+            roly_home=chosen_roly_home,
+        )
+        cfg = replace(cfg, setup=persisted_setup)
+
+        config_file = config_path(app_ctx.project_root)
+        should_persist = yes or _confirm(
+            app_ctx, f"Persist setup defaults to {config_file}?"
+        )
+        if should_persist:
+            write_config(config_file, cfg)
+
+        app_ctx.console.print(
+            Panel.fit(
+                "\n".join(
+                    [
+                        f"agent: {chosen_agent}",
+                        f"destination: {result.destination}",
+                        f"status: {result.action}",
+                    ]
+                ),
+                title="Setup Complete",
+            )
+        )
+    except (RolyError, OSError) as error:
+        _handle_error(app_ctx, error)
+
+
+def run_assemble(
+    app_ctx: AppContext,
+    *,
+    config: Path | None,
+    user_role: str | None,
+    role: list[str] | None,
+    name: str | None,
+    output: Path | None,
+) -> None:
+    """Assemble a deterministic user role artifact."""
+    from rich.panel import Panel
+
+    from .assembler import (
+        merge_output_definitions,
+        render_assembled_role,
+        resolve_output_filename,
+        write_assembled_role,
+    )
+
+    try:
+        cfg, project_roles_dir = _project_roles_dir(app_ctx, explicit_config=config)
+        output_dir_cfg = cfg.paths.output_dir if cfg else DEFAULT_OUTPUT_DIR
+
+        config_output_filename: str | None = None
+        user_role_name: str
+        requested_roles: list[str]
+
+        if role:
+            requested_roles = list(role)
+            user_role_name = name or f"{requested_roles[0]}-ad-hoc"
+        else:
+            if cfg is None:
+                raise ConfigError("No config found and no --role values provided")
+            if not cfg.user_roles:
+                raise ConfigError("Config has no [[user_roles]] entries")
+            if user_role is None:
+                if len(cfg.user_roles) != 1:
+                    raise ConfigError(
+                        "Multiple user roles in config; choose one with --user-role"
+                    )
+                selected = cfg.user_roles[0]
+            else:
+                matches = [entry for entry in cfg.user_roles if entry.name == user_role]
+                if not matches:
+                    raise ConfigError(f"User role not found in config: {user_role}")
+                selected = matches[0]
+
+            requested_roles = selected.resolved_roles()
+            if selected.roles == [] and selected.top_level_role is not None:
+                app_ctx.console.print(
+                    "[yellow]Config uses legacy top_level_role/sub_roles; migrate to 'roles' list.[/yellow]"
+                )
+            if not requested_roles:
+                raise ConfigError("Selected user role has no roles configured")
+            config_output_filename = selected.output_filename
+            user_role_name = selected.name
+
+        top_role_doc, sub_role_docs = _resolve_role_chain(
+            app_ctx=app_ctx,
+            role_slugs=requested_roles,
+            project_roles_dir=project_roles_dir,
+        )
+
+        merged_output = merge_output_definitions(
+            top_role_doc, sub_role_docs, copy_inputs=False
+        )
+        content = render_assembled_role(
+            user_role_name=user_role_name,
+            top_role=top_role_doc,
+            sub_roles=sub_role_docs,
+            merged_output=merged_output,
+        )
+
+        if output is not None:
+            # os.path.join keeps an absolute --output as-is.
+            output_dir, filename = os.path.split(
+                os.path.join(app_ctx.project_root, output)
+            )
+            destination = write_assembled_role(
+                content=content, output_dir=output_dir, filename=filename
+            )
+        else:
+            filename = resolve_output_filename(
+                output_override=None,
+                config_output_filename=config_output_filename,
+                merged_output=merged_output,
+                top_role=top_role_doc,
+                sub_roles=sub_role_docs,
+            )
+            destination = write_assembled_role(
+                content=content,
+                output_dir=os.path.join(app_ctx.project_root, output_dir_cfg),
+                filename=filename,
+            )
+
+        app_ctx.console.print(
+            Panel.fit(
+                "\n".join(
+                    [
+                        f"output: {destination}",
+                        f"top-level: {top_role_doc.slug}",
+                        (
+                            f"sub-roles: {', '.join(role.slug for role in sub_role_docs)}"
+                            if sub_role_docs
+                            else "sub-roles: (none)"
+                        ),
+                    ]
+                ),
+                title="Assemble Complete",
+            )
+        )
+    except (RolyError, OSError) as error:
+        _handle_error(app_ctx, error)
+
+
+def run_diff(app_ctx: AppContext, *, role: str | None, role_path: Path | None) -> None:
+    """Show diff between project-local and user-level role versions."""
+    from .diffing import build_unified_diff
+    from .role_store import local_project_role, local_user_role
+    from .ui import print_diff
+
+    try:
+        _, project_roles_dir = _project_roles_dir(app_ctx)
+        role_kind, role_slug = _resolve_role_target(
+            app_ctx=app_ctx,
+            role=role,
+            role_path=role_path,
+            project_roles_dir=project_roles_dir,
+            for_promote=False,
+        )
+
+        project_role = local_project_role(
+            kind=role_kind,
+            slug=role_slug,
+            project_root=app_ctx.project_root,
+            project_roles_dir=project_roles_dir,
+        )
+        user_role = local_user_role(
+            kind=role_kind, slug=role_slug, user_home=app_ctx.user_home
+        )
+
+        diff_lines = build_unified_diff(
+            before=user_role.source_path.read_text(encoding="utf-8"),
+            after=project_role.source_path.read_text(encoding="utf-8"),
+            from_label=str(user_role.source_path),
+            to_label=str(project_role.source_path),
+        )
+        print_diff(app_ctx.console, diff_lines)
+    except (RolyError, OSError) as error:
+        _handle_error(app_ctx, error)
+
+
+def run_promote(
+    app_ctx: AppContext, *, role: str | None, role_path: Path | None, yes: bool
+) -> None:
+    """Promote a project-local role to user-level by overwrite."""
+    from .role_store import local_project_role, local_user_role_path
+
+    try:
+        _, project_roles_dir = _project_roles_dir(app_ctx)
+        role_kind, role_slug = _resolve_role_target(
+            app_ctx=app_ctx,
+            role=role,
+            role_path=role_path,
+            project_roles_dir=project_roles_dir,
+            for_promote=True,
+        )
+
+        project_role = local_project_role(
+            kind=role_kind,
+            slug=role_slug,
+            project_root=app_ctx.project_root,
+            project_roles_dir=project_roles_dir,
+        )
+        destination = local_user_role_path(
+            kind=role_kind,
+            slug=role_slug,
+            user_home=app_ctx.user_home,
+        )
+
+        should_write = yes or _confirm(
+            app_ctx, f"Overwrite user-level role at {destination}?", default=False
+        )
+        if not should_write:
+            app_ctx.console.print("Promotion cancelled.")
+            return
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text(
+            project_role.source_path.read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+
+        app_ctx.console.print(
+            f"Promoted {role_kind.value}:{role_slug} -> {destination}"
+        )
+    except (RolyError, OSError) as error:
+        _handle_error(app_ctx, error)
+
+
+def run_review(
+    app_ctx: AppContext,
+    *,
+    target_sub_role: list[str] | None,
+    changes_file: Path | None,
+    transcript: Path | None,
+    active_user_role: Path | None,
+    use_stub: bool,
+) -> None:
+    """Run interactive review update approval flow for sub-role files."""
+    from rich.panel import Panel
+
+    from .review import (
+        apply_change_with_result,
+        load_review_changes,
+        stub_review_changes,
+    )
+    from .role_store import local_project_role
+    from .ui import print_renderables, prompt_change_action, render_change_preview
+
+    _ = transcript
+    _ = active_user_role
+
+    if not target_sub_role:
+        _handle_error(app_ctx, ConfigError("Provide at least one --target-sub-role"))
+
+    try:
+        _, project_roles_dir = _project_roles_dir(app_ctx)
+
+        targets = target_sub_role or []
+        if changes_file is None and not use_stub:
+            raise ConfigError("Provide --changes-file or pass --use-stub")
+        if changes_file is None:
+            changes = stub_review_changes(targets)
+        else:
+            changes = load_review_changes(changes_file)
+
+        role_text_by_slug: dict[str, str] = {}
+        role_path_by_slug: dict[str, Path] = {}
+        for slug in targets:
+            role_doc = local_project_role(
+                kind=RoleKind.SUB_ROLE,
+                slug=slug,
+                project_root=app_ctx.project_root,
+                project_roles_dir=project_roles_dir,
+            )
+            role_text_by_slug[slug] = role_doc.source_path.read_text(encoding="utf-8")
+            role_path_by_slug[slug] = role_doc.source_path
+
+        accepted_applied = 0
+        accepted_noop = 0
+        rejected = 0
+        skipped = 0
+        written_files: set[str] = set()
+        accept_all = False
+
+        pending: list[RenderableType] = []
+        try:
+            for index, change in enumerate(changes):
+                if change.target_kind is not RoleKind.SUB_ROLE:
+                    raise ReviewApplyError(
+                        "Review workflow cannot auto-modify top-level roles"
+                    )
+                if change.target_slug not in role_text_by_slug:
+                    raise ReviewApplyError(
+                        f"Review change target '{change.target_slug}' is not in --target-sub-role"
+                    )
+
+                pending.append(render_change_preview(change))
+                if accept_all:
+                    action = "y"
+                else:
+                    print_renderables(app_ctx.console, pending)
+                    action = prompt_change_action(app_ctx.console)
+                if action == "q":
+                    skipped += len(changes) - index
+                    break
+                if action == "n":
+                    rejected += 1
+                    continue
+                if action == "a":
+                    accept_all = True
+                    action = "y"
+
+                result = apply_change_with_result(
+                    role_text_by_slug[change.target_slug], change
+                )
+                if result.applied:
+                    role_text_by_slug[change.target_slug] = result.content
+                    written_files.add(change.target_slug)
+                    accepted_applied += 1
+                else:
+                    accepted_noop += 1
+                    if result.message:
+                        pending.append(
+                            f"[yellow]{result.message}[/yellow] for {change.target_slug}"
+                        )
+
+            for slug in sorted(written_files):
+                role_path_by_slug[slug].write_text(
+                    role_text_by_slug[slug], encoding="utf-8"
+                )
+
+            pending.append(
+                Panel.fit(
+                    "\n".join(
+                        [
+                            f"accepted_applied: {accepted_applied}",
+                            f"accepted_noop: {accepted_noop}",
+                            f"rejected: {rejected}",
+                            f"skipped: {skipped}",
+                            f"files written: {len(written_files)}",
+                        ]
+                    ),
+                    title="Review Update Summary",
+                )
+            )
+        finally:
+            print_renderables(app_ctx.console, pending)
+    except (RolyError, OSError) as error:
+        _handle_error(app_ctx, error)
@@ -2,79 +2,171 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
-from datetime import UTC, datetime
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
 from .models import OutputDefinition, OutputSection, RoleDocument, SectionType
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 DEFAULT_FILENAME_TEMPLATE = "review_{subrole-or-role}_{timestamp}.md"
 
+_LIST: Final = SectionType.LIST
+
+_TEMPLATE_TOKEN_RE = re.compile(r"\{(subrole-or-role|timestamp)\}")
+
+
+@lru_cache(maxsize=32)
+def _parse_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a filename template into static chunks and token names."""
+    pieces = _TEMPLATE_TOKEN_RE.split(template)
+    return tuple(pieces[::2]), tuple(pieces[1::2])
+
+
+def _render_template(
+    parts: tuple[tuple[str, ...], tuple[str, ...]], values: dict[str, str]
+) -> str:
+    """Render pre-parsed template parts by interleaving statics and values."""
+    statics, keys = parts
+    chunks = [statics[0]]
+    for key, static in zip(keys, statics[1:], strict=True):
+        chunks.append(values[key])
+        chunks.append(static)
+    return "".join(chunks)
+
+
+_DEFAULT_TEMPLATE_PARTS = _parse_template(DEFAULT_FILENAME_TEMPLATE)
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Above this many additions, dedup in bulk and extend once instead of appending.
+_BULK_DEDUP_THRESHOLD = 16
+
+
+def _extend_unique(target: list[str], seen: set[str], additions: list[str]) -> None:
+    """Extend ``target`` in place with strings not yet present in ``seen``."""
+    if len(additions) > _BULK_DEDUP_THRESHOLD:
+        new_items = [item for item in dict.fromkeys(additions) if item not in seen]
+        seen.update(new_items)
+        target.extend(new_items)
+        return
 
-def _append_unique(existing: list[str], additions: list[str]) -> list[str]:
-    """Append unique strings while preserving order."""
-    seen = set(existing)
-    merged = list(existing)
     for item in additions:
         if item not in seen:
             seen.add(item)
-            merged.append(item)
-    return merged
+            target.append(item)
+
+
+@dataclass(slots=True)
+class _SectionAccumulator:
+    """Mutable merge state for one output section and its dedup caches."""
+
+    section: OutputSection
+    guidance_seen: set[str] = field(default_factory=set)
+    fields_seen: set[str] = field(default_factory=set)
+    item_contributions_seen: set[str] = field(default_factory=set)
+    owned: bool = True
+    conflict_noted: bool = False
+
+    @classmethod
+    def from_section(
+        cls, section: OutputSection, *, copy: bool = True
+    ) -> _SectionAccumulator:
+        """Start accumulating from the first definition of a section."""
+        merged = clone_section(section) if copy else section
+        return cls(
+            section=merged,
+            guidance_seen=set(merged.guidance),
+            fields_seen=set(merged.fields),
+            item_contributions_seen=set(merged.item_contributions),
+            owned=copy,
+        )
+
+    def owned_section(self) -> OutputSection:
+        """Return the accumulated section, copying a borrowed input on first write."""
+        if not self.owned:
+            self.section = clone_section(self.section)
+            self.owned = True
+        return self.section
+
+
+def _append_conflict_note(acc: _SectionAccumulator) -> None:
+    """Record a section type conflict once per merged section."""
+    if acc.conflict_noted:
+        return
+    acc.conflict_noted = True
+    section = acc.owned_section()
+    note = (
+        "Conflict detected: section type mismatch encountered during merge; "
+        f"kept '{section.type.value}' from first definition."
+    )
+    _extend_unique(section.guidance, acc.guidance_seen, [note])
 
 
 def merge_output_definitions(
-    top_role: RoleDocument, sub_roles: list[RoleDocument]
+    top_role: RoleDocument,
+    sub_roles: list[RoleDocument],
+    *,
+    copy_inputs: bool = True,
 ) -> OutputDefinition:
-    """Merge output definitions using deterministic section-key semantics."""
-    merged_sections: list[OutputSection] = []
-    index_by_key: dict[str, int] = {}
+    """Merge output definitions using deterministic section-key semantics.
+
+    With ``copy_inputs=False`` a section defined by only one role is reused as-is
+    rather than copied; sections are still copied before any merge writes to them.
+    """
+    by_key: dict[str, _SectionAccumulator] = {}
+    accumulator_for_key = by_key.get
 
+    filename_template: str | None = None
     ordered_roles = [top_role, *sub_roles]
     for role in ordered_roles:
+        if (
+            filename_template is None
+            and role is not top_role
+            and role.output.filename_template
+        ):
+            filename_template = role.output.filename_template
+
         for section in role.output.sections:
             normalized = section.normalized_key
-            index = index_by_key.get(normalized)
-            if index is None:
-                merged_sections.append(
-                    OutputSection(
-                        key=section.key,
-                        type=section.type,
-                        guidance=list(section.guidance),
-                        fields=list(section.fields),
-                        item_contributions=list(section.item_contributions),
-                    )
+            acc = accumulator_for_key(normalized)
+            if acc is None:
+                by_key[normalized] = _SectionAccumulator.from_section(
+                    section, copy=copy_inputs
                 )
-                index_by_key[normalized] = len(merged_sections) - 1
                 continue
 
-            current = merged_sections[index]
-            if current.type is not section.type:
-                note = (
-                    "Conflict detected: section type mismatch encountered during merge; "
-                    f"kept '{current.type.value}' from first definition."
-                )
-                current.guidance = _append_unique(current.guidance, [note])
+            if acc.section.type is not section.type:
+                _append_conflict_note(acc)
                 continue
 
-            current.guidance = _append_unique(current.guidance, section.guidance)
-            if current.type is SectionType.LIST:
-                current.fields = _append_unique(current.fields, section.fields)
-                current.item_contributions = _append_unique(
+            current = acc.owned_section()
+
+            _extend_unique(current.guidance, acc.guidance_seen, section.guidance)
+            if current.type is _LIST:
+                _extend_unique(current.fields, acc.fields_seen, section.fields)
+                _extend_unique(
                     current.item_contributions,
+                    acc.item_contributions_seen,
                     section.item_contributions,
                 )
 
-    filename_template: str | None = None
-    for role in sub_roles:
-        if role.output.filename_template:
-            filename_template = role.output.filename_template
-            break
+    return OutputDefinition(
+        filename_template=filename_template or top_role.output.filename_template,
+        sections=[acc.section for acc in by_key.values()],
+    )
 
-    if filename_template is None:
-        filename_template = top_role.output.filename_template
 
-    return OutputDefinition(
-        filename_template=filename_template, sections=merged_sections
+def _format_timestamp(moment: datetime) -> str:
+    """Format a datetime as ``%Y%m%dT%H%M%SZ`` without going through strftime."""
+    return (
+        f"{moment.year:04d}{moment.month:02d}{moment.day:02d}"
+        f"T{moment.hour:02d}{moment.minute:02d}{moment.second:02d}Z"
     )
 
 
@@ -94,14 +186,37 @@ def resolve_output_filename(
     if config_output_filename:
         return config_output_filename
 
-    template = merged_output.filename_template or DEFAULT_FILENAME_TEMPLATE
+    template = merged_output.filename_template
+    parts = _parse_template(template) if template else _DEFAULT_TEMPLATE_PARTS
 
-    timestamp = (now or datetime.now(UTC)).strftime("%Y%m%dT%H%M%SZ")
-    token_value = sub_roles[0].slug if sub_roles else top_role.slug
+    values = {"subrole-or-role": (sub_roles or [top_role])[0].slug}
+    if "timestamp" in parts[1]:
+        if now is None:
+            from datetime import UTC, datetime
+
+            now = datetime.now(UTC)
+        values["timestamp"] = _format_timestamp(now)
+
+    return _render_template(parts, values)
+
+
+def _render_bullets(label: str, items: list[str]) -> str:
+    """Render one labelled bullet block, or nothing when there are no items."""
+    if not items:
+        return ""
+    bullets = "\n".join(f"  - {item}" for item in items)
+    return f"\n- {label}:\n{bullets}"
 
-    return template.replace("{subrole-or-role}", token_value).replace(
-        "{timestamp}", timestamp
-    )
+
+def _render_section(section: OutputSection) -> str:
+    """Render one resolved output section as a single markdown block."""
+    guidance = _render_bullets("Guidance", section.guidance)
+    fields = ""
+    items = ""
+    if section.type is _LIST:
+        fields = _render_bullets("Fields", section.fields)
+        items = _render_bullets("Item Contributions", section.item_contributions)
+    return f"\n### {section.key} ({section.type.value}){guidance}{fields}{items}"
 
 
 def render_assembled_role(
@@ -112,64 +227,70 @@ def render_assembled_role(
     merged_output: OutputDefinition,
 ) -> str:
     """Render assembled user role markdown file content."""
-    lines: list[str] = []
-    lines.append(f"# User Role: {user_role_name}")
-    lines.append("")
-    lines.append("## Composition")
-    lines.append(f"- Top-Level Role: `{top_role.slug}` ({top_role.source_scope})")
     if sub_roles:
-        lines.append("- Sub-Roles:")
-        lines.extend(
+        sub_role_lines = "\n".join(
             f"  - `{sub_role.slug}` ({sub_role.source_scope})" for sub_role in sub_roles
         )
+        composition_sub_roles = f"- Sub-Roles:\n{sub_role_lines}"
     else:
-        lines.append("- Sub-Roles: (none)")
-    lines.append("")
-
-    lines.append("## Resolved Output Definition")
-    for section in merged_output.sections:
-        lines.append("")
-        lines.append(f"### {section.key} ({section.type.value})")
-        if section.guidance:
-            lines.append("- Guidance:")
-            lines.extend(f"  - {guidance}" for guidance in section.guidance)
-        if section.type is SectionType.LIST and section.fields:
-            lines.append("- Fields:")
-            lines.extend(f"  - {field_name}" for field_name in section.fields)
-        if section.type is SectionType.LIST and section.item_contributions:
-            lines.append("- Item Contributions:")
-            lines.extend(
-                f"  - {contribution}" for contribution in section.item_contributions
-            )
-
-    lines.append("")
-    lines.append("## Instructions")
-    lines.append("")
-    lines.append(f"### Top-Level Role: {top_role.name}")
-    lines.append(top_role.body.rstrip())
-
-    for sub_role in sub_roles:
-        lines.append("")
-        lines.append(f"### Sub-Role: {sub_role.name}")
-        lines.append(sub_role.body.rstrip())
-
-    lines.append("")
-    return "\n".join(lines)
-
-
-def write_assembled_role(*, content: str, output_dir: Path, filename: str) -> Path:
+        composition_sub_roles = "- Sub-Roles: (none)"
+
+    header = (
+        f"# User Role: {user_role_name}\n\n"
+        "## Composition\n"
+        f"- Top-Level Role: `{top_role.slug}` ({top_role.source_scope})\n"
+        f"{composition_sub_roles}\n"
+    )
+    parts: list[str] = [header, "## Resolved Output Definition"]
+
+    parts.extend(_render_section(section) for section in merged_output.sections)
+
+    parts.append(
+        "\n## Instructions\n\n"
+        f"### Top-Level Role: {top_role.name}\n"
+        f"{top_role.body.rstrip()}"
+    )
+
+    parts.extend(
+        f"\n### Sub-Role: {sub_role.name}\n{sub_role.body.rstrip()}"
+        for sub_role in sub_roles
+    )
+
+    return "\n".join(parts) + "\n"
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write bytes through a raw file descriptor, bypassing buffered file objects."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def write_assembled_role(
+    *, content: str, output_dir: str | os.PathLike[str], filename: str
+) -> Path:
     """Write assembled role content to disk and return resulting path."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    destination = output_dir / filename
-    destination.write_text(content, encoding="utf-8")
-    return destination
+    destination = os.path.join(output_dir, filename)
+    data = content.encode("utf-8")
+    try:
+        _write_bytes(destination, data)
+    except FileNotFoundError:
+        os.makedirs(output_dir, exist_ok=True)
+        _write_bytes(destination, data)
+    return Path(destination)
 
 
 def clone_section(section: OutputSection) -> OutputSection:
     """Return a deep-ish clone of an output section."""
-    return replace(
-        section,
-        guidance=list(section.guidance),
-        fields=list(section.fields),
-        item_contributions=list(section.item_contributions),
+    return OutputSection(
+        key=section.key,
+        type=section.type,
+        guidance=section.guidance.copy(),
+        fields=section.fields.copy(),
+        item_contributions=section.item_contributions.copy(),
     )
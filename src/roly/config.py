@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import time
 import tomllib
+from io import StringIO
 from pathlib import Path
 
 from .errors import ConfigError
-from .models import PathsConfig, RolyConfig, SetupConfig, UserRoleConfig
+from .models import (
+    SETUP_AGENTS,
+    PathsConfig,
+    RolyConfig,
+    SetupConfig,
+    UserRoleConfig,
+)
 from .paths import DEFAULT_OUTPUT_DIR, DEFAULT_PROJECT_ROLES_DIR
 
+# Files modified this recently may still be mid-write by a non-atomic editor.
+_CONFIG_CACHE_SETTLE_NS = 1_000_000_000
+_config_cache: dict[str, tuple[int, int, RolyConfig]] = {}
+_TOML_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def _expect_string(
     data: dict[str, object], key: str, *, required: bool = True
@@ -32,16 +45,19 @@ def _expect_list_of_strings(data: dict[str, object], key: str) -> list[str]:
     if raw is None:
         return []
 
-    if not isinstance(raw, list) or not all(isinstance(item, str) for item in raw):
+    if type(raw) is not list:
         raise ConfigError(f"Expected '{key}' to be an array of strings")
+    for item in raw:
+        if type(item) is not str:
+            raise ConfigError(f"Expected '{key}' to be an array of strings")
 
-    return list(raw)
+    # The decoded array belongs to this parse, so it is returned without a copy.
+    return raw
 
 
 def _render_toml_string(value: str) -> str:
     """Render one TOML string literal."""
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-    return f'"{escaped}"'
+    return f'"{value.translate(_TOML_ESCAPE)}"'
 
 
 def _render_toml_string_list(values: list[str]) -> str:
@@ -60,7 +76,7 @@ def _parse_setup(raw_setup: object) -> SetupConfig:
 
     agent = _expect_string(raw_setup, "agent", required=False)
     if agent is not None:
-        if agent not in {"none", "codex"}:
+        if agent not in SETUP_AGENTS:
             raise ConfigError("'setup.agent' must be 'none' or 'codex'")
         setup.agent = agent
 
@@ -97,11 +113,11 @@ def _parse_user_role(entry: object) -> UserRoleConfig:
 
 def load_config(path: Path) -> RolyConfig:
     """Load and validate a Roly config file."""
-    if not path.exists():
-        raise ConfigError(f"Config not found: {path}")
-
-    with path.open("rb") as handle:
-        raw = tomllib.load(handle)
+    try:
+        with path.open("rb") as handle:
+            raw = tomllib.load(handle)
+    except FileNotFoundError as error:
+        raise ConfigError(f"Config not found: {path}") from error
 
     if not isinstance(raw, dict):
         raise ConfigError("Config root must be a TOML table")
@@ -143,37 +159,57 @@ def load_config(path: Path) -> RolyConfig:
     )
 
 
+def load_config_cached(path: Path) -> RolyConfig:
+    """Load a config, reusing the previous parse while the file is unchanged.
+
+    The returned config may be shared between calls and must not be mutated.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return load_config(path)
+
+    key = str(path)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    config = load_config(path)
+    if time.time_ns() - stat.st_mtime_ns > _CONFIG_CACHE_SETTLE_NS:
+        _config_cache[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
 def write_config(path: Path, config: RolyConfig) -> None:
     """Write roly.config using deterministic key ordering."""
-    lines: list[str] = [f"version = {config.version}", ""]
-    lines.extend(
-        [
-            "[paths]",
-            f"project_roles_dir = {_render_toml_string(config.paths.project_roles_dir)}",
-            f"output_dir = {_render_toml_string(config.paths.output_dir)}",
-            "",
-            "[setup]",
-            f"agent = {_render_toml_string(config.setup.agent)}",
-        ]
-    )
-    if config.setup.skill_dir is not None:
-        lines.append(f"skill_dir = {_render_toml_string(config.setup.skill_dir)}")
-    if config.setup.codex_dir is not None:
-        lines.append(f"codex_dir = {_render_toml_string(config.setup.codex_dir)}")
-    if config.setup.roly_home is not None:
-        lines.append(f"roly_home = {_render_toml_string(config.setup.roly_home)}")
+    _config_cache.pop(str(path), None)
+    buffer = StringIO()
+    write = buffer.write
+    paths = config.paths
+    setup = config.setup
+    write(f"version = {config.version}\n\n")
+    write("[paths]\n")
+    write(f"project_roles_dir = {_render_toml_string(paths.project_roles_dir)}\n")
+    write(f"output_dir = {_render_toml_string(paths.output_dir)}\n\n")
+    write("[setup]\n")
+    write(f"agent = {_render_toml_string(setup.agent)}\n")
+    if setup.skill_dir is not None:
+        write(f"skill_dir = {_render_toml_string(setup.skill_dir)}\n")
+    if setup.codex_dir is not None:
+        write(f"codex_dir = {_render_toml_string(setup.codex_dir)}\n")
+    if setup.roly_home is not None:
+        write(f"roly_home = {_render_toml_string(setup.roly_home)}\n")
 
     for role in config.user_roles:
-        lines.extend(["", "[[user_roles]]", f"name = {_render_toml_string(role.name)}"])
+        write(f"\n[[user_roles]]\nname = {_render_toml_string(role.name)}\n")
         if role.roles:
-            lines.append(f"roles = {_render_toml_string_list(role.roles)}")
+            write(f"roles = {_render_toml_string_list(role.roles)}\n")
         elif role.top_level_role:
-            lines.append(f"top_level_role = {_render_toml_string(role.top_level_role)}")
+            write(f"top_level_role = {_render_toml_string(role.top_level_role)}\n")
             if role.sub_roles:
-                lines.append(f"sub_roles = {_render_toml_string_list(role.sub_roles)}")
+                write(f"sub_roles = {_render_toml_string_list(role.sub_roles)}\n")
         if role.output_filename is not None:
-            lines.append(
-                f"output_filename = {_render_toml_string(role.output_filename)}"
-            )
+            write(f"output_filename = {_render_toml_string(role.output_filename)}\n")
 
-    path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    # Encode explicitly so no text-mode newline translation is applied.
+    path.write_bytes((buffer.getvalue().rstrip() + "\n").encode("utf-8"))
@@ -5,11 +5,13 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AppContext:
     """Shared CLI context."""
 
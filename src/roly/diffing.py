@@ -3,6 +3,13 @@
 from __future__ import annotations
 
 from difflib import unified_diff
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_PREFIX_CLASSES = {"+": "add", "-": "remove", "@": "meta"}
+_FILE_HEADERS = frozenset({"+++", "---"})
 
 
 def build_unified_diff(
@@ -11,25 +18,26 @@ def build_unified_diff(
     after: str,
     from_label: str,
     to_label: str,
-) -> list[str]:
-    """Build a unified diff between two text blobs."""
-    return list(
-        unified_diff(
-            before.splitlines(),
-            after.splitlines(),
-            fromfile=from_label,
-            tofile=to_label,
-            lineterm="",
-        )
+) -> Iterator[str]:
+    """Lazily yield a unified diff between two text blobs."""
+    if before == after:
+        return iter(())
+    return unified_diff(
+        before.splitlines(),
+        after.splitlines(),
+        fromfile=from_label,
+        tofile=to_label,
+        lineterm="",
     )
 
 
 def classify_diff_line(line: str) -> str:
     """Classify a diff line for CLI color rendering."""
-    if line.startswith(("+++", "---", "@@")):
+    cls = _PREFIX_CLASSES.get(line[:1])
+    if cls is None:
+        return "context"
+    if cls == "meta":
+        return cls if line[:2] == "@@" else "context"
+    if line[:3] in _FILE_HEADERS:
         return "meta"
-    if line.startswith("+"):
-        return "add"
-    if line.startswith("-"):
-        return "remove"
-    return "context"
+    return cls
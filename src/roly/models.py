@@ -38,11 +38,11 @@ class OutputSection:
     guidance: list[str] = field(default_factory=list)
     fields: list[str] = field(default_factory=list)
     item_contributions: list[str] = field(default_factory=list)
+    normalized_key: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def normalized_key(self) -> str:
-        """Return case-normalized key used for deterministic merging."""
-        return self.key.strip().casefold()
+    def __post_init__(self) -> None:
+        """Cache the case-normalized key used for deterministic merging."""
+        self.normalized_key = self.key.strip().casefold()
 
 
 @dataclass(slots=True)
@@ -98,6 +98,9 @@ class UserRoleConfig:
         return legacy
 
 
+SETUP_AGENTS = ("none", "codex")
+
+
 @dataclass(slots=True)
 class SetupConfig:
     """Persisted setup defaults from roly.config."""
@@ -8,6 +8,7 @@ from .models import RoleKind
 
 DEFAULT_PROJECT_ROLES_DIR = ".roly/roles"
 DEFAULT_OUTPUT_DIR = ".roly/generated"
+KIND_DIRNAMES = {RoleKind.TOP_LEVEL: "top_level", RoleKind.SUB_ROLE: "sub_roles"}
 
 
 def config_path(project_root: Path) -> Path:
@@ -29,10 +30,7 @@ def scope_root(
 
 def kind_dir(root: Path, kind: RoleKind) -> Path:
     """Return the directory containing role files for the given kind."""
-    if kind is RoleKind.TOP_LEVEL:
-        return root / "top_level"
-
-    return root / "sub_roles"
+    return root / KIND_DIRNAMES[kind]
 
 
 def slug_to_filename(slug: str) -> str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -19,18 +20,22 @@ class ChangeApplyResult:
     message: str | None = None
 
 
+_KIND_BY_VALUE = {kind.value: kind for kind in RoleKind}
+_OP_BY_VALUE = {op.value: op for op in ChangeOp}
+_OPTIONAL_STR_FIELDS = ("anchor", "text", "old_text", "new_text")
+
+
 def _parse_change(table: dict[str, object], source: Path) -> ReviewChange:
     """Parse one review change table from TOML data."""
     target_kind_raw = table.get("target_kind")
     if not isinstance(target_kind_raw, str):
         raise ReviewApplyError(f"'target_kind' must be a string in {source}")
 
-    try:
-        target_kind = RoleKind(target_kind_raw)
-    except ValueError as error:
+    target_kind = _KIND_BY_VALUE.get(target_kind_raw)
+    if target_kind is None:
         raise ReviewApplyError(
             f"Unsupported target kind '{target_kind_raw}' in {source}"
-        ) from error
+        )
 
     target_slug = table.get("target_slug")
     if not isinstance(target_slug, str) or not target_slug:
@@ -40,42 +45,30 @@ def _parse_change(table: dict[str, object], source: Path) -> ReviewChange:
     if not isinstance(op_raw, str):
         raise ReviewApplyError(f"'op' must be a string in {source}")
 
-    try:
-        op = ChangeOp(op_raw)
-    except ValueError as error:
-        raise ReviewApplyError(f"Unsupported op '{op_raw}' in {source}") from error
-
-    anchor = table.get("anchor")
-    text = table.get("text")
-    old_text = table.get("old_text")
-    new_text = table.get("new_text")
-
-    if anchor is not None and not isinstance(anchor, str):
-        raise ReviewApplyError(f"'anchor' must be a string in {source}")
-    if text is not None and not isinstance(text, str):
-        raise ReviewApplyError(f"'text' must be a string in {source}")
-    if old_text is not None and not isinstance(old_text, str):
-        raise ReviewApplyError(f"'old_text' must be a string in {source}")
-    if new_text is not None and not isinstance(new_text, str):
-        raise ReviewApplyError(f"'new_text' must be a string in {source}")
+    op = _OP_BY_VALUE.get(op_raw)
+    if op is None:
+        raise ReviewApplyError(f"Unsupported op '{op_raw}' in {source}")
+
+    values: dict[str, str | None] = {}
+    for key in _OPTIONAL_STR_FIELDS:
+        value = table.get(key)
+        # TOML strings always decode to exact `str`, so skip the MRO walk.
+        if value is not None and type(value) is not str:
+            raise ReviewApplyError(f"'{key}' must be a string in {source}")
+        values[key] = value
 
+    text = values["text"]
     if op is ChangeOp.ADD and not text:
         raise ReviewApplyError(f"'text' is required for add operations in {source}")
     if op is ChangeOp.REMOVE and not text:
         raise ReviewApplyError(f"'text' is required for remove operations in {source}")
-    if op is ChangeOp.MODIFY and (not old_text or new_text is None):
+    if op is ChangeOp.MODIFY and (not values["old_text"] or values["new_text"] is None):
         raise ReviewApplyError(
             f"'old_text' and 'new_text' are required for modify operations in {source}"
         )
 
     return ReviewChange(
-        target_kind=target_kind,
-        target_slug=target_slug,
-        op=op,
-        anchor=anchor,
-        text=text,
-        old_text=old_text,
-        new_text=new_text,
+        target_kind=target_kind, target_slug=sys.intern(target_slug), op=op, **values
     )
 
 
@@ -152,9 +145,9 @@ def _apply_add(content: str, change: ReviewChange) -> tuple[str, bool]:
         raise ReviewApplyError("add operation requires text")
 
     text_to_add = change.text.strip()
-    if change.anchor and change.anchor in content:
-        anchor_start = content.find(change.anchor)
-        anchor_end = anchor_start + len(change.anchor)
+    anchor = change.anchor
+    if anchor and (anchor_start := content.find(anchor)) != -1:
+        anchor_end = anchor_start + len(anchor)
         trailing = content[anchor_end:]
         expected_prefix = f"\n{text_to_add}"
         if trailing.startswith(expected_prefix):
@@ -2,35 +2,52 @@
 
 from __future__ import annotations
 
+import os
+import sys
+import time
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import cast
 
 from .errors import RoleParseError
 from .models import OutputDefinition, OutputSection, RoleDocument, RoleKind, SectionType
 
+# Plain dict lookups avoid the Enum call machinery in per-role/per-section code.
+_KIND_BY_VALUE = {kind.value: kind for kind in RoleKind}
+_SECTION_BY_VALUE = {section_type.value: section_type for section_type in SectionType}
+# Up to this many files a thread pool costs more than it overlaps.
+_SERIAL_READ_LIMIT = 2
+# Files modified this recently may still be mid-write by a non-atomic editor.
+_ROLE_CACHE_SETTLE_NS = 1_000_000_000
+_role_cache: dict[tuple[str, str], tuple[int, int, RoleDocument]] = {}
 
-def _extract_front_matter(raw_text: str, source_path: Path) -> tuple[str, str]:
-    """Extract TOML front matter and body from a role markdown document."""
-    lines = raw_text.splitlines(keepends=True)
-    if not lines or lines[0].strip() != "+++":
+
+def _extract_front_matter(raw: bytes, source_path: Path) -> tuple[bytes, bytes]:
+    """Split undecoded role file bytes into TOML front matter and body."""
+    start = raw.find(b"\n") + 1
+    opening = raw[: start or len(raw)]
+    if opening.strip() != b"+++":
         raise RoleParseError(
             f"Role file must start with TOML front matter: {source_path}"
         )
 
-    closing_index = -1
-    for index in range(1, len(lines)):
-        if lines[index].strip() == "+++":
-            closing_index = index
-            break
-
-    if closing_index == -1:
-        raise RoleParseError(
-            f"Role file is missing front matter closing delimiter: {source_path}"
-        )
+    # Scan delimiter candidates with bytes.find instead of splitting every line.
+    hit = raw.find(b"+++", start) if start else -1
+    while hit != -1:
+        line_start = raw.rfind(b"\n", start - 1, hit) + 1
+        line_end = raw.find(b"\n", hit)
+        if line_end == -1:
+            line_end = len(raw)
+        if raw[line_start:line_end].strip() == b"+++":
+            front_matter = raw[start:line_start]
+            body = raw[line_end + 1 :].lstrip(b"\n")
+            return front_matter, body
+        hit = raw.find(b"+++", line_end)
 
-    front_matter = "".join(lines[1:closing_index])
-    body = "".join(lines[closing_index + 1 :]).lstrip("\n")
-    return front_matter, body
+    raise RoleParseError(
+        f"Role file is missing front matter closing delimiter: {source_path}"
+    )
 
 
 def _expect_string(table: dict[str, object], key: str, source_path: Path) -> str:
@@ -46,16 +63,144 @@ def _read_string_list(value: object, key: str, source_path: Path) -> list[str]:
     if value is None:
         return []
 
-    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+    if type(value) is not list:
         raise RoleParseError(f"'{key}' must be an array of strings in {source_path}")
+    for item in value:
+        if type(item) is not str:
+            raise RoleParseError(
+                f"'{key}' must be an array of strings in {source_path}"
+            )
+
+    # Arrays decoded from this file's front matter are not shared; keep them.
+    return value
+
+
+def _build_sections(sections_raw: list[object], path: Path) -> list[OutputSection]:
+    """Validate and build output sections from a decoded `output.sections` array."""
+    sections: list[OutputSection] = []
+    for section in sections_raw:
+        if not isinstance(section, dict):
+            raise RoleParseError(f"Each output section must be a table in {path}")
+
+        key = _expect_string(section, "key", path)
+        section_type_raw = _expect_string(section, "type", path)
+        section_type = _SECTION_BY_VALUE.get(section_type_raw)
+        if section_type is None:
+            raise RoleParseError(
+                f"Unsupported section type '{section_type_raw}' in {path}"
+            )
+
+        guidance = _read_string_list(section.get("guidance"), "guidance", path)
+        fields = _read_string_list(section.get("fields"), "fields", path)
+        item_contributions = _read_string_list(
+            section.get("item_contributions"), "item_contributions", path
+        )
+
+        sections.append(
+            OutputSection(
+                key=key,
+                type=section_type,
+                guidance=guidance,
+                fields=fields,
+                item_contributions=item_contributions,
+            )
+        )
+    return sections
+
+
+def bulk_read_role_files(paths: list[Path]) -> list[bytes]:
+    """Read several role files, overlapping the reads when there are many."""
+    if len(paths) <= _SERIAL_READ_LIMIT:
+        return [path.read_bytes() for path in paths]
+
+    # Reads are I/O-bound, so allow more threads than cores (the executor's
+    # own default), but never more than there are files.
+    workers = min(32, (os.cpu_count() or 1) + 4, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(Path.read_bytes, paths))
+
 
-    return list(value)
+def parse_role_files(entries: list[tuple[Path, str]]) -> list[RoleDocument]:
+    """Parse several `(path, scope)` role files, preserving input order.
+
+    Unchanged files are served from the parse cache; returned documents may be
+    shared between calls and must not be mutated.
+    """
+    documents: list[RoleDocument | None] = []
+    misses: list[tuple[int, Path, str, os.stat_result]] = []
+    for index, (path, scope) in enumerate(entries):
+        stat = path.stat()
+        document = _cached_role(path, scope, stat)
+        documents.append(document)
+        if document is None:
+            misses.append((index, path, scope, stat))
+
+    contents = bulk_read_role_files([path for _, path, _, _ in misses])
+    # Decoding and validation hold the GIL, so only the reads run in parallel.
+    for (index, path, scope, stat), raw in zip(misses, contents, strict=True):
+        documents[index] = _remember_role(
+            path, scope, stat, parse_role_bytes(raw, path, scope)
+        )
+    return cast("list[RoleDocument]", documents)
 
 
 def parse_role_file(path: Path, source_scope: str) -> RoleDocument:
     """Parse a role markdown file into a typed role document."""
-    raw_text = path.read_text(encoding="utf-8")
-    front_matter_text, body = _extract_front_matter(raw_text, path)
+    return parse_role_bytes(path.read_bytes(), path, source_scope)
+
+
+def _cached_role(
+    path: Path, source_scope: str, stat: os.stat_result
+) -> RoleDocument | None:
+    """Return the cached parse of path if the file is unchanged."""
+    cached = _role_cache.get((str(path), source_scope))
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    return None
+
+
+def _remember_role(
+    path: Path, source_scope: str, stat: os.stat_result, document: RoleDocument
+) -> RoleDocument:
+    """Cache a fresh parse unless the file may still be mid-write."""
+    if time.time_ns() - stat.st_mtime_ns > _ROLE_CACHE_SETTLE_NS:
+        key = (str(path), source_scope)
+        _role_cache[key] = (stat.st_mtime_ns, stat.st_size, document)
+    return document
+
+
+def parse_role_file_cached(path: Path, source_scope: str) -> RoleDocument:
+    """Parse a role file, reusing the previous parse while it is unchanged.
+
+    The returned document may be shared between calls and must not be mutated.
+    """
+    stat = path.stat()
+    document = _cached_role(path, source_scope, stat)
+    if document is not None:
+        return document
+    return _remember_role(
+        path,
+        source_scope,
+        stat,
+        parse_role_bytes(path.read_bytes(), path, source_scope),
+    )
+
+
+def clear_role_cache() -> None:
+    """Drop every cached role parse."""
+    _role_cache.clear()
+
+
+def parse_role_bytes(raw: bytes, path: Path, source_scope: str) -> RoleDocument:
+    """Parse already-read role file bytes into a typed role document."""
+    if b"\r" in raw:
+        # Match text-mode universal newlines; CR never occurs inside a UTF-8
+        # multi-byte sequence, so this is safe before decoding.
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    # Locate the delimiters on bytes and decode only the two slices.
+    front_matter_raw, body_raw = _extract_front_matter(raw, path)
+    front_matter_text = front_matter_raw.decode("utf-8")
+    body = body_raw.decode("utf-8")
 
     try:
         table = tomllib.loads(front_matter_text)
@@ -63,10 +208,9 @@ def parse_role_file(path: Path, source_scope: str) -> RoleDocument:
         raise RoleParseError(f"Invalid TOML front matter in {path}: {error}") from error
 
     kind_raw = _expect_string(table, "kind", path)
-    try:
-        kind = RoleKind(kind_raw)
-    except ValueError as error:
-        raise RoleParseError(f"Unsupported role kind '{kind_raw}' in {path}") from error
+    kind = _KIND_BY_VALUE.get(kind_raw)
+    if kind is None:
+        raise RoleParseError(f"Unsupported role kind '{kind_raw}' in {path}")
 
     name = _expect_string(table, "name", path)
     slug = _expect_string(table, "slug", path)
@@ -105,47 +249,22 @@ def parse_role_file(path: Path, source_scope: str) -> RoleDocument:
                 f"'output.sections' must be an array of tables in {path}"
             )
 
-        for section in sections_raw:
-            if not isinstance(section, dict):
-                raise RoleParseError(f"Each output section must be a table in {path}")
-
-            key = _expect_string(section, "key", path)
-            section_type_raw = _expect_string(section, "type", path)
-            try:
-                section_type = SectionType(section_type_raw)
-            except ValueError as error:
-                raise RoleParseError(
-                    f"Unsupported section type '{section_type_raw}' in {path}"
-                ) from error
-
-            guidance = _read_string_list(section.get("guidance"), "guidance", path)
-            fields = _read_string_list(section.get("fields"), "fields", path)
-            item_contributions = _read_string_list(
-                section.get("item_contributions"), "item_contributions", path
-            )
-
-            sections.append(
-                OutputSection(
-                    key=key,
-                    type=section_type,
-                    guidance=guidance,
-                    fields=fields,
-                    item_contributions=item_contributions,
-                )
-            )
+        sections = _build_sections(sections_raw, path)
 
     output = OutputDefinition(filename_template=filename_template, sections=sections)
 
+    # Slugs and scopes are compared and used as dict keys across every role;
+    # interning makes those comparisons identity checks.
     return RoleDocument(
         kind=kind,
-        name=name,
-        slug=slug,
+        name=sys.intern(name),
+        slug=sys.intern(slug),
         version=version,
-        depends_on_top_level=depends_on_top_level.strip()
+        depends_on_top_level=sys.intern(depends_on_top_level.strip())
         if isinstance(depends_on_top_level, str)
         else None,
         output=output,
         body=body,
-        source_scope=source_scope,
+        source_scope=sys.intern(source_scope),
         source_path=path,
     )
@@ -2,22 +2,68 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 from .errors import ConfigError, RoleNotFoundError
 from .models import RoleDocument, RoleKind
-from .paths import kind_dir, scope_root, slug_to_filename
-from .role_parser import parse_role_file
+from .paths import KIND_DIRNAMES, kind_dir, scope_root, slug_to_filename
+from .role_parser import (
+    parse_role_file,
+    parse_role_file_cached,
+    parse_role_files,
+)
+
+_BUILTIN_ROOT = Path(__file__).resolve().parent / "builtin"
+# Directories changed this recently may still be receiving files.
+_LISTING_SETTLE_NS = 1_000_000_000
+_listing_cache: dict[str, tuple[int, frozenset[str]]] = {}
+_SCOPES_BY_FILTER = {
+    "all": ("builtin", "user", "project"),
+    "builtin": ("builtin",),
+    "user": ("user",),
+    "project": ("project",),
+}
+_KINDS_BY_FILTER = {
+    "all": (RoleKind.TOP_LEVEL, RoleKind.SUB_ROLE),
+    "top-level": (RoleKind.TOP_LEVEL,),
+    "sub-role": (RoleKind.SUB_ROLE,),
+}
 
 
 def builtin_roles_root() -> Path:
     """Return filesystem path containing built-in roles."""
-    return Path(__file__).resolve().parent / "builtin"
+    return _BUILTIN_ROOT
 
 
 def _role_path(root: Path, kind: RoleKind, slug: str) -> Path:
     """Build a role file path from root/kind/slug."""
-    return kind_dir(root, kind) / slug_to_filename(slug)
+    # One Path construction instead of two chained divisions.
+    return Path(root, KIND_DIRNAMES[kind], slug_to_filename(slug))
+
+
+def _role_filenames(directory: Path) -> frozenset[str]:
+    """Return file names in a role directory, reusing unchanged listings."""
+    key = str(directory)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    cached = _listing_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        # DirEntry.is_file() reuses readdir's d_type instead of a stat.
+        with os.scandir(key) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+    if time.time_ns() - mtime_ns > _LISTING_SETTLE_NS:
+        _listing_cache[key] = (mtime_ns, names)
+    return names
 
 
 def load_role_from_root(
@@ -25,11 +71,11 @@ def load_role_from_root(
 ) -> RoleDocument | None:
     """Load one role from a specific root if the file exists."""
     path = _role_path(root, kind, slug)
-    if not path.exists():
+    try:
+        return parse_role_file_cached(path, scope)
+    except FileNotFoundError:
         return None
 
-    return parse_role_file(path, scope)
-
 
 def resolve_role(
     *,
@@ -40,27 +86,20 @@ def resolve_role(
     project_roles_dir: str,
 ) -> RoleDocument:
     """Resolve a role using project > user > built-in precedence."""
-    project = load_role_from_root(
-        scope_root("project", project_root, user_home, project_roles_dir),
-        "project",
-        kind,
-        slug,
-    )
-    if project is not None:
-        return project
-
-    user = load_role_from_root(
-        scope_root("user", project_root, user_home, project_roles_dir),
-        "user",
-        kind,
-        slug,
+    roots = (
+        ("project", scope_root("project", project_root, user_home, project_roles_dir)),
+        ("user", scope_root("user", project_root, user_home, project_roles_dir)),
+        ("builtin", builtin_roles_root()),
     )
-    if user is not None:
-        return user
-
-    builtin = load_role_from_root(builtin_roles_root(), "builtin", kind, slug)
-    if builtin is not None:
-        return builtin
+    searched: set[Path] = set()
+    for scope, root in roots:
+        # A project_roles_dir pointing at the user roles dir would repeat a miss.
+        if root in searched:
+            continue
+        searched.add(root)
+        role = load_role_from_root(root, scope, kind, slug)
+        if role is not None:
+            return role
 
     raise RoleNotFoundError(f"Role not found ({kind}): {slug}")
 
@@ -99,32 +138,24 @@ def list_roles(
     kind_filter: str,
 ) -> list[RoleDocument]:
     """List roles across configured scopes with filters."""
-    scopes: list[tuple[str, Path]] = []
-    if scope_filter in {"all", "builtin"}:
-        scopes.append(("builtin", builtin_roles_root()))
-    if scope_filter in {"all", "user"}:
-        scopes.append(("user", user_home / "roles"))
-    if scope_filter in {"all", "project"}:
-        scopes.append(("project", project_root / project_roles_dir))
-
-    kinds: list[RoleKind] = []
-    if kind_filter in {"all", "top-level"}:
-        kinds.append(RoleKind.TOP_LEVEL)
-    if kind_filter in {"all", "sub-role"}:
-        kinds.append(RoleKind.SUB_ROLE)
-
-    roles: list[RoleDocument] = []
-    for scope_name, root in scopes:
+    roots = {
+        "builtin": builtin_roles_root(),
+        "user": user_home / "roles",
+        "project": project_root / project_roles_dir,
+    }
+    kinds = _KINDS_BY_FILTER.get(kind_filter, ())
+
+    listed: list[tuple[Path, str]] = []
+    for scope_name in _SCOPES_BY_FILTER.get(scope_filter, ()):
+        root = roots[scope_name]
         for kind in kinds:
             directory = kind_dir(root, kind)
-            if not directory.exists():
-                continue
-            roles.extend(
-                parse_role_file(file, scope_name)
-                for file in sorted(directory.glob("*.md"))
+            names = sorted(
+                name for name in _role_filenames(directory) if name.endswith(".md")
             )
+            listed.extend((directory / name, scope_name) for name in names)
 
-    return roles
+    return parse_role_files(listed)
 
 
 def infer_role_kind(
@@ -135,16 +166,17 @@ def infer_role_kind(
     project_roles_dir: str,
 ) -> RoleKind:
     """Infer role kind from slug and fail on ambiguity or absence."""
-    matches: list[RoleKind] = []
-    for kind in (RoleKind.TOP_LEVEL, RoleKind.SUB_ROLE):
-        for root in (
-            project_root / project_roles_dir,
-            user_home / "roles",
-            builtin_roles_root(),
-        ):
-            if _role_path(root, kind, slug).exists():
-                matches.append(kind)
-                break
+    filename = slug_to_filename(slug)
+    roots = (
+        project_root / project_roles_dir,
+        user_home / "roles",
+        builtin_roles_root(),
+    )
+    matches = [
+        kind
+        for kind in (RoleKind.TOP_LEVEL, RoleKind.SUB_ROLE)
+        if any((kind_dir(root, kind) / filename).is_file() for root in roots)
+    ]
 
     if not matches:
         raise RoleNotFoundError(f"Role not found: {slug}")
@@ -159,10 +191,12 @@ def infer_project_role_kind(
     *, slug: str, project_root: Path, project_roles_dir: str
 ) -> RoleKind:
     """Infer role kind from project-local role files."""
+    filename = slug_to_filename(slug)
+    root = project_root / project_roles_dir
     matches = [
         kind
         for kind in (RoleKind.TOP_LEVEL, RoleKind.SUB_ROLE)
-        if _role_path(project_root / project_roles_dir, kind, slug).exists()
+        if (kind_dir(root, kind) / filename).is_file()
     ]
     if not matches:
         raise RoleNotFoundError(f"Project role not found: {slug}")
@@ -37,64 +37,70 @@ def default_none_skill_path(project_root: Path) -> Path:
     return project_root / "roly_review_skill.md"
 
 
+_NONE_PROMPT = "\n".join(
+    [
+        f"roly_skill_id: {SKILL_ID}",
+        f"roly_template_version: {TEMPLATE_VERSION}",
+        f"roly_template_timestamp: {TEMPLATE_TIMESTAMP}",
+        "",
+        "# Roly Review Skill",
+        "",
+        "Use this workflow to generate review changes for Roly.",
+        "",
+        "## Inputs",
+        "- Active assembled user role",
+        "- Conversation context and user feedback",
+        "- Target sub-role slugs",
+        "",
+        "## Output format",
+        "Produce TOML with `[[changes]]` entries:",
+        '- `target_kind = "sub-role"`',
+        '- `target_slug = "..."`',
+        '- `op = "add"|"remove"|"modify"`',
+        "- `anchor`, `text`, `old_text`, `new_text` as required by op",
+        "",
+        "## Constraints",
+        "- Never target top-level roles.",
+        "- Prefer minimal, deterministic text edits.",
+        "- Keep suggestions concrete and verifiable.",
+        "",
+    ]
+)
+
+
 def render_none_prompt() -> str:
     """Render portable review skill prompt."""
-    return "\n".join(
-        [
-            f"roly_skill_id: {SKILL_ID}",
-            f"roly_template_version: {TEMPLATE_VERSION}",
-            f"roly_template_timestamp: {TEMPLATE_TIMESTAMP}",
-            "",
-            "# Roly Review Skill",
-            "",
-            "Use this workflow to generate review changes for Roly.",
-            "",
-            "## Inputs",
-            "- Active assembled user role",
-            "- Conversation context and user feedback",
-            "- Target sub-role slugs",
-            "",
-            "## Output format",
-            "Produce TOML with `[[changes]]` entries:",
-            '- `target_kind = "sub-role"`',
-            '- `target_slug = "..."`',
-            '- `op = "add"|"remove"|"modify"`',
-            "- `anchor`, `text`, `old_text`, `new_text` as required by op",
-            "",
-            "## Constraints",
-            "- Never target top-level roles.",
-            "- Prefer minimal, deterministic text edits.",
-            "- Keep suggestions concrete and verifiable.",
-            "",
-        ]
-    )
+    return _NONE_PROMPT
+
+
+_CODEX_SKILL_MD = "\n".join(
+    [
+        "---",
+        "name: roly-review",
+        "description: Generate deterministic Roly review changes in TOML for roly review --changes-file.",
+        "---",
+        "",
+        f"roly_skill_id: {SKILL_ID}",
+        f"roly_template_version: {TEMPLATE_VERSION}",
+        f"roly_template_timestamp: {TEMPLATE_TIMESTAMP}",
+        "",
+        "# Roly Review",
+        "",
+        "Generate `[[changes]]` TOML entries for Roly sub-role updates.",
+        "",
+        "Required behavior:",
+        '- Only emit `target_kind = "sub-role"`.',
+        "- Keep changes minimal and deterministic.",
+        "- Prefer `modify` over broad `remove`+`add` when possible.",
+        "- Include exact anchor/text values that can be applied safely.",
+        "",
+    ]
+)
 
 
 def render_codex_skill_md() -> str:
     """Render Codex SKILL.md for review workflow."""
-    return "\n".join(
-        [
-            "---",
-            "name: roly-review",
-            "description: Generate deterministic Roly review changes in TOML for roly review --changes-file.",
-            "---",
-            "",
-            f"roly_skill_id: {SKILL_ID}",
-            f"roly_template_version: {TEMPLATE_VERSION}",
-            f"roly_template_timestamp: {TEMPLATE_TIMESTAMP}",
-            "",
-            "# Roly Review",
-            "",
-            "Generate `[[changes]]` TOML entries for Roly sub-role updates.",
-            "",
-            "Required behavior:",
-            '- Only emit `target_kind = "sub-role"`.',
-            "- Keep changes minimal and deterministic.",
-            "- Prefer `modify` over broad `remove`+`add` when possible.",
-            "- Include exact anchor/text values that can be applied safely.",
-            "",
-        ]
-    )
+    return _CODEX_SKILL_MD
 
 
 def _extract_metadata(content: str) -> tuple[str | None, str | None, str | None]:
@@ -114,9 +120,12 @@ def _extract_metadata(content: str) -> tuple[str | None, str | None, str | None]
 
 def needs_update(destination: Path, content: str, *, force: bool) -> bool:
     """Return whether destination should be overwritten."""
-    if force or not destination.exists():
+    if force:
+        return True
+    try:
+        existing = destination.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return True
-    existing = destination.read_text(encoding="utf-8")
     existing_id, existing_version, existing_timestamp = _extract_metadata(existing)
     new_id, new_version, new_timestamp = _extract_metadata(content)
     if existing_id != new_id:
@@ -169,19 +178,14 @@ def merged_setup_config(
     """Build persisted setup defaults by merging explicit overrides."""
     return SetupConfig(
         agent=agent,
-        skill_dir=(
-            str(skill_dir.expanduser().resolve())
-            if skill_dir is not None
-            else existing.skill_dir
-        ),
-        codex_dir=(
-            str(codex_dir.expanduser().resolve())
-            if codex_dir is not None
-            else existing.codex_dir
-        ),
-        roly_home=(
-            str(roly_home.expanduser().resolve())
-            if roly_home is not None
-            else existing.roly_home
-        ),
+        skill_dir=_normalized_path(skill_dir, existing.skill_dir),
+        codex_dir=_normalized_path(codex_dir, existing.codex_dir),
+        roly_home=_normalized_path(roly_home, existing.roly_home),
     )
+
+
+def _normalized_path(path: Path | None, fallback: str | None) -> str | None:
+    """Return the canonical string form of an explicit path, else the fallback."""
+    if path is None:
+        return fallback
+    return os.path.realpath(os.path.expanduser(path))
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from rich.console import Console
+from collections.abc import Iterable
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
@@ -21,38 +23,49 @@ def print_roles_table(console: Console, roles: list[RoleDocument]) -> None:
     table.add_column("Name")
     table.add_column("Path")
 
-    for role in roles:
-        table.add_row(
+    rows = [
+        (
             role.source_scope,
             role.kind.value,
             role.slug,
             role.name,
             str(role.source_path),
         )
+        for role in roles
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
 
-def print_diff(console: Console, diff_lines: list[str]) -> None:
+_DIFF_STYLES = {"add": "green", "remove": "red", "meta": "yellow"}
+
+
+def print_diff(console: Console, diff_lines: Iterable[str]) -> None:
     """Render a unified diff with semantic coloring."""
-    if not diff_lines:
+    buffer = Text()
+    for line in diff_lines:
+        if buffer:
+            buffer.append("\n")
+        buffer.append(line, style=_DIFF_STYLES.get(classify_diff_line(line)))
+
+    if not buffer:
         console.print("No differences found.")
         return
+    console.print(buffer)
 
-    for line in diff_lines:
-        cls = classify_diff_line(line)
-        if cls == "add":
-            console.print(Text(line, style="green"))
-        elif cls == "remove":
-            console.print(Text(line, style="red"))
-        elif cls == "meta":
-            console.print(Text(line, style="yellow"))
-        else:
-            console.print(line)
-
-
-def print_change_preview(console: Console, change: ReviewChange) -> None:
-    """Render a single review change preview panel."""
+
+def print_renderables(console: Console, renderables: list[RenderableType]) -> None:
+    """Print buffered renderables with one console call and clear the buffer."""
+    if renderables:
+        console.print(Group(*renderables))
+        renderables.clear()
+
+
+def render_change_preview(change: ReviewChange) -> Panel:
+    """Build a single review change preview panel."""
     lines = [
         f"target: {change.target_kind.value}:{change.target_slug}",
         f"operation: {change.op.value}",
@@ -76,7 +89,7 @@ def print_change_preview(console: Console, change: ReviewChange) -> None:
         "modify": "yellow",
     }[change.op.value]
 
-    console.print(Panel("\n".join(lines), title="Proposed Change", border_style=style))
+    return Panel("\n".join(lines), title="Proposed Change", border_style=style)
 
 
 def prompt_change_action(console: Console) -> str:
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+
+from roly.models import RoleKind
+from roly.paths import kind_dir
+
+_OUTPUT_LINES = (
+    "[output]",
+    "",
+    "[[output.sections]]",
+    'key = "Issues"',
+    'type = "list"',
+    'guidance = ["guidance"]',
+)
+
+
+class WriteRoleFile(Protocol):
+    def __call__(
+        self,
+        root: Path,
+        kind: RoleKind,
+        slug: str,
+        body: str,
+        *,
+        with_output: bool = True,
+    ) -> Path: ...
+
+
+def _write_role_file(
+    root: Path, kind: RoleKind, slug: str, body: str, *, with_output: bool = True
+) -> Path:
+    lines = [
+        "+++",
+        f'kind = "{kind.value}"',
+        f'name = "{slug.replace("-", " ").title()}"',
+        f'slug = "{slug}"',
+        'version = "1.0.0"',
+    ]
+    if kind is RoleKind.SUB_ROLE:
+        lines.append('depends_on_top_level = "reviewer"')
+    lines.append("")
+    if with_output:
+        lines.extend(_OUTPUT_LINES)
+    lines.extend(("+++", "", body, ""))
+    path = kind_dir(root, kind) / f"{slug}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def write_role_file() -> WriteRoleFile:
+    return _write_role_file
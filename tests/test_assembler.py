@@ -1,7 +1,13 @@
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 
-from roly.assembler import merge_output_definitions, resolve_output_filename
+from roly.assembler import (
+    merge_output_definitions,
+    render_assembled_role,
+    resolve_output_filename,
+    write_assembled_role,
+)
 from roly.models import (
     OutputDefinition,
     OutputSection,
@@ -183,3 +189,129 @@ def test_filename_resolution_uses_default_template_without_role_templates():
     )
 
     assert filename == "review_reviewer_20260101T000000Z.md"
+
+
+def test_filename_resolution_renders_repeated_tokens_and_keeps_unknown_braces():
+    top = _role(
+        kind=RoleKind.TOP_LEVEL,
+        slug="reviewer",
+        filename_template="{subrole-or-role}/{other}_{timestamp}_{subrole-or-role}.md",
+        sections=[],
+    )
+    merged = merge_output_definitions(top, [])
+
+    filename = resolve_output_filename(
+        output_override=None,
+        config_output_filename=None,
+        merged_output=merged,
+        top_role=top,
+        sub_roles=[],
+        now=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+    assert filename == "reviewer/{other}_20260101T000000Z_reviewer.md"
+
+
+def test_merge_dedups_large_contributions_in_order():
+    top = _role(
+        kind=RoleKind.TOP_LEVEL,
+        slug="reviewer",
+        sections=[
+            OutputSection(key="Issues", type=SectionType.LIST, guidance=["g0", "g5"])
+        ],
+    )
+    guidance = [f"g{index % 20}" for index in range(40)]
+    sub = _role(
+        kind=RoleKind.SUB_ROLE,
+        slug="code-review",
+        sections=[
+            OutputSection(key="Issues", type=SectionType.LIST, guidance=guidance)
+        ],
+    )
+
+    merged = merge_output_definitions(top, [sub])
+
+    expected = ["g0", "g5"] + [f"g{i}" for i in range(20) if i not in {0, 5}]
+    assert merged.sections[0].guidance == expected
+
+
+def test_render_assembled_role_emits_sections_and_instructions():
+    top = _role(
+        kind=RoleKind.TOP_LEVEL,
+        slug="reviewer",
+        sections=[
+            OutputSection(key="Summary", type=SectionType.TEXT, guidance=["short"]),
+            OutputSection(
+                key="Issues",
+                type=SectionType.LIST,
+                fields=["severity"],
+                item_contributions=["one per finding"],
+            ),
+        ],
+    )
+    sub = _role(kind=RoleKind.SUB_ROLE, slug="code-review", sections=[])
+    merged = merge_output_definitions(top, [sub])
+
+    content = render_assembled_role(
+        user_role_name="my-role",
+        top_role=top,
+        sub_roles=[sub],
+        merged_output=merged,
+    )
+
+    assert content == (
+        "# User Role: my-role\n"
+        "\n"
+        "## Composition\n"
+        "- Top-Level Role: `reviewer` (builtin)\n"
+        "- Sub-Roles:\n"
+        "  - `code-review` (builtin)\n"
+        "\n"
+        "## Resolved Output Definition\n"
+        "\n"
+        "### Summary (text)\n"
+        "- Guidance:\n"
+        "  - short\n"
+        "\n"
+        "### Issues (list)\n"
+        "- Fields:\n"
+        "  - severity\n"
+        "- Item Contributions:\n"
+        "  - one per finding\n"
+        "\n"
+        "## Instructions\n"
+        "\n"
+        "### Top-Level Role: reviewer\n"
+        "Body for reviewer\n"
+        "\n"
+        "### Sub-Role: code-review\n"
+        "Body for code-review\n"
+    )
+
+
+def test_merge_without_input_copies_leaves_inputs_unmodified():
+    top_issues = OutputSection(key="Issues", type=SectionType.LIST, guidance=["top"])
+    top = _role(kind=RoleKind.TOP_LEVEL, slug="reviewer", sections=[top_issues])
+    sub = _role(
+        kind=RoleKind.SUB_ROLE,
+        slug="code-review",
+        sections=[OutputSection(key="Issues", type=SectionType.LIST, guidance=["sub"])],
+    )
+
+    merged = merge_output_definitions(top, [sub], copy_inputs=False)
+
+    assert merged.sections[0].guidance == ["top", "sub"]
+    assert top_issues.guidance == ["top"]
+
+
+def test_write_assembled_role_leaves_file_mode_to_umask(tmp_path: Path):
+    previous = os.umask(0o002)
+    try:
+        path = write_assembled_role(
+            content="# Role\n", output_dir=tmp_path / "out", filename="role.md"
+        )
+    finally:
+        os.umask(previous)
+
+    assert path.read_text(encoding="utf-8") == "# Role\n"
+    assert path.stat().st_mode & 0o777 == 0o664
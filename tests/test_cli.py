@@ -1,64 +1,81 @@
 from __future__ import annotations
 
 import re
+import shutil
 from pathlib import Path
 
-from typer.testing import CliRunner
+import click
+import pytest
+from click.testing import CliRunner
+from conftest import WriteRoleFile
+from typer.main import get_command
 
-from roly.cli import app
+from roly.cli import app, app_for_args
 from roly.models import RoleKind
 from roly.paths import kind_dir
 
-runner = CliRunner()
+_SKIPPED_RE = re.compile(r"skipped: [1-9]")
+_ANSI_ESCAPE = "\x1b["
 
 
-def _write_role_file(root: Path, kind: RoleKind, slug: str, body: str) -> Path:
-    dependency_line = (
-        'depends_on_top_level = "reviewer"\n' if kind is RoleKind.SUB_ROLE else ""
-    )
-    path = kind_dir(root, kind) / f"{slug}.md"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        """+++
-kind = "{kind}"
-name = "{name}"
-slug = "{slug}"
-version = "1.0.0"
-{dependency_line}
-[output]
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
 
-[[output.sections]]
-key = "Issues"
-type = "list"
-guidance = ["guidance"]
-+++
 
-{body}
-""".format(
-            kind=kind.value,
-            name=slug.replace("-", " ").title(),
-            slug=slug,
-            dependency_line=dependency_line,
-            body=body,
-        ),
-        encoding="utf-8",
-    )
-    return path
+@pytest.fixture(scope="module")
+def cli() -> click.Command:
+    return get_command(app)
 
 
 def _role_root(path: Path) -> Path:
     return path / ".roly" / "roles"
 
 
+@pytest.fixture(scope="session")
+def review_roles_template(
+    tmp_path_factory: pytest.TempPathFactory, write_role_file: WriteRoleFile
+) -> Path:
+    root = tmp_path_factory.mktemp("review-roles")
+    for slug in ("code-review", "project-audit"):
+        write_role_file(
+            root,
+            RoleKind.SUB_ROLE,
+            slug,
+            "# Review\n\n## Evaluation Areas\n- existing item",
+        )
+    return root
+
+
+@pytest.fixture
+def review_roles(review_roles_template: Path, tmp_path: Path) -> Path:
+    # Review rewrites role files in place, so copy rather than hardlink.
+    root = _role_root(tmp_path)
+    shutil.copytree(review_roles_template, root)
+    return kind_dir(root, RoleKind.SUB_ROLE)
+
+
+def _base_argv(project_root: Path) -> tuple[str, ...]:
+    return (
+        "--project-root",
+        str(project_root),
+        "--user-home",
+        str(project_root / "home"),
+        "--no-color",
+    )
+
+
 def _write_config(path: Path, content: str) -> Path:
     config = path / "roly.config"
     config.write_text(content, encoding="utf-8")
     return config
 
 
-def test_setup_none_writes_default_prompt_and_persists_config(tmp_path: Path):
+def test_setup_none_writes_default_prompt_and_persists_config(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     result = runner.invoke(
-        app,
+        cli,
         [
             "--project-root",
             str(tmp_path),
@@ -79,10 +96,12 @@ def test_setup_none_writes_default_prompt_and_persists_config(tmp_path: Path):
     assert 'agent = "none"' in config_text
 
 
-def test_setup_none_interactive_wizard(tmp_path: Path):
+def test_setup_none_interactive_wizard(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     interactive_input = "none\ncustom/skill.md\ny\ny\n"
     result = runner.invoke(
-        app,
+        cli,
         ["--project-root", str(tmp_path), "--no-color", "setup"],
         input=interactive_input,
     )
@@ -91,10 +110,12 @@ def test_setup_none_interactive_wizard(tmp_path: Path):
     assert (tmp_path / "custom" / "skill.md").exists()
 
 
-def test_setup_codex_installs_skill(tmp_path: Path):
+def test_setup_codex_installs_skill(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     codex_root = tmp_path / "codex-skills"
     result = runner.invoke(
-        app,
+        cli,
         [
             "--project-root",
             str(tmp_path),
@@ -114,34 +135,31 @@ def test_setup_codex_installs_skill(tmp_path: Path):
     assert "name: roly-review" in skill_path.read_text(encoding="utf-8")
 
 
-def test_list_shows_builtin_roles_no_color(tmp_path: Path):
+def test_list_shows_builtin_roles_no_color(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "list",
         ],
     )
 
     assert result.exit_code == 0
-    assert "reviewer" in result.stdout
-    assert "code-review" in result.stdout
-    assert "\x1b[" not in result.stdout
+    out = result.stdout
+    assert "reviewer" in out
+    assert "code-review" in out
+    assert _ANSI_ESCAPE not in out
 
 
-def test_assemble_errors_without_config_or_role(tmp_path: Path):
+def test_assemble_errors_without_config_or_role(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "assemble",
         ],
     )
@@ -150,15 +168,13 @@ def test_assemble_errors_without_config_or_role(tmp_path: Path):
     assert "No config found and no --role values provided" in result.stdout
 
 
-def test_assemble_ad_hoc_infers_dependency_and_name(tmp_path: Path):
+def test_assemble_ad_hoc_infers_dependency_and_name(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "assemble",
             "--role",
             "code-review",
@@ -178,9 +194,14 @@ def test_assemble_ad_hoc_infers_dependency_and_name(tmp_path: Path):
     assert "`code-review`" in content
 
 
-def test_assemble_ad_hoc_rejects_conflicting_sub_role_dependencies(tmp_path: Path):
+def test_assemble_ad_hoc_rejects_conflicting_sub_role_dependencies(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
     project_roles_root = _role_root(tmp_path)
-    _write_role_file(
+    write_role_file(
         project_roles_root,
         RoleKind.TOP_LEVEL,
         "auditor",
@@ -203,13 +224,9 @@ depends_on_top_level = "auditor"
     )
 
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "assemble",
             "--role",
             "code-review",
@@ -222,7 +239,9 @@ depends_on_top_level = "auditor"
     assert "conflicting top-level dependencies" in result.stdout
 
 
-def test_assemble_config_mode_accepts_roles_list(tmp_path: Path):
+def test_assemble_config_mode_accepts_roles_list(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     _write_config(
         tmp_path,
         """version = 1
@@ -235,13 +254,9 @@ output_filename = "from-config.md"
     )
 
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "assemble",
         ],
     )
@@ -251,7 +266,9 @@ output_filename = "from-config.md"
     assert output_file.exists()
 
 
-def test_assemble_config_legacy_fields_still_work(tmp_path: Path):
+def test_assemble_config_legacy_fields_still_work(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     _write_config(
         tmp_path,
         """version = 1
@@ -264,13 +281,9 @@ output_filename = "legacy.md"
 """,
     )
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "assemble",
         ],
     )
@@ -280,20 +293,21 @@ output_filename = "legacy.md"
     assert (tmp_path / ".roly" / "generated" / "legacy.md").exists()
 
 
-def test_diff_infers_role_kind_from_slug(tmp_path: Path):
+def test_diff_infers_role_kind_from_slug(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
     project_root = _role_root(tmp_path)
     user_root = (tmp_path / "home") / "roles"
-    _write_role_file(project_root, RoleKind.SUB_ROLE, "code-review", "project body")
-    _write_role_file(user_root, RoleKind.SUB_ROLE, "code-review", "user body")
+    write_role_file(project_root, RoleKind.SUB_ROLE, "code-review", "project body")
+    write_role_file(user_root, RoleKind.SUB_ROLE, "code-review", "user body")
 
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "diff",
             "--role",
             "code-review",
@@ -301,26 +315,28 @@ def test_diff_infers_role_kind_from_slug(tmp_path: Path):
     )
 
     assert result.exit_code == 0
-    assert "+project body" in result.stdout
-    assert "-user body" in result.stdout
+    lines = set(result.stdout.splitlines())
+    assert "+project body" in lines
+    assert "-user body" in lines
 
 
-def test_diff_supports_role_path_escape_hatch(tmp_path: Path):
+def test_diff_supports_role_path_escape_hatch(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
     project_root = _role_root(tmp_path)
     user_root = (tmp_path / "home") / "roles"
-    project_file = _write_role_file(
+    project_file = write_role_file(
         project_root, RoleKind.TOP_LEVEL, "reviewer", "project top"
     )
-    _write_role_file(user_root, RoleKind.TOP_LEVEL, "reviewer", "user top")
+    write_role_file(user_root, RoleKind.TOP_LEVEL, "reviewer", "user top")
 
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "diff",
             "--role-path",
             str(project_file),
@@ -328,25 +344,26 @@ def test_diff_supports_role_path_escape_hatch(tmp_path: Path):
     )
 
     assert result.exit_code == 0
-    assert "+project top" in result.stdout
+    assert "+project top" in result.stdout.splitlines()
 
 
-def test_promote_infers_kind_and_overwrites(tmp_path: Path):
+def test_promote_infers_kind_and_overwrites(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
     project_root = _role_root(tmp_path)
     user_root = (tmp_path / "home") / "roles"
-    project_role = _write_role_file(
+    project_role = write_role_file(
         project_root, RoleKind.SUB_ROLE, "code-review", "project-promoted"
     )
-    _write_role_file(user_root, RoleKind.SUB_ROLE, "code-review", "old-user")
+    write_role_file(user_root, RoleKind.SUB_ROLE, "code-review", "old-user")
 
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "promote",
             "--role",
             "code-review",
@@ -361,15 +378,33 @@ def test_promote_infers_kind_and_overwrites(tmp_path: Path):
     )
 
 
-def test_review_requires_changes_file_or_stub(tmp_path: Path):
+def test_promote_normalizes_crlf_line_endings(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
+    project_role = write_role_file(
+        _role_root(tmp_path), RoleKind.SUB_ROLE, "code-review", "project-promoted"
+    )
+    project_role.write_bytes(project_role.read_bytes().replace(b"\n", b"\r\n"))
+
+    result = runner.invoke(
+        cli, [*_base_argv(tmp_path), "promote", "--role", "code-review", "--yes"]
+    )
+
+    assert result.exit_code == 0
+    user_file = tmp_path / "home" / "roles" / "sub_roles" / "code-review.md"
+    assert b"\r" not in user_file.read_bytes()
+
+
+def test_review_requires_changes_file_or_stub(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "review",
             "--target-sub-role",
             "code-review",
@@ -379,22 +414,14 @@ def test_review_requires_changes_file_or_stub(tmp_path: Path):
     assert "Provide --changes-file or pass --use-stub" in result.stdout
 
 
-def test_review_stub_flow_still_works_with_flag(tmp_path: Path):
-    project_root = _role_root(tmp_path)
-    role_file = _write_role_file(
-        project_root,
-        RoleKind.SUB_ROLE,
-        "code-review",
-        "# Code Review\n\n## Evaluation Areas\n- existing item",
-    )
+def test_review_stub_flow_still_works_with_flag(
+    runner: CliRunner, cli: click.Command, tmp_path: Path, review_roles: Path
+):
+    role_file = review_roles / "code-review.md"
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "review",
             "--target-sub-role",
             "code-review",
@@ -408,29 +435,141 @@ def test_review_stub_flow_still_works_with_flag(tmp_path: Path):
     assert "acceptance-criteria checks" in updated
 
 
-def test_review_quit_reports_skipped(tmp_path: Path):
-    project_root = _role_root(tmp_path)
-    _write_role_file(
-        project_root,
+@pytest.mark.usefixtures("review_roles")
+def test_review_quit_reports_skipped(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
+    result = runner.invoke(
+        cli,
+        [
+            *_base_argv(tmp_path),
+            "review",
+            "--target-sub-role",
+            "code-review",
+            "--use-stub",
+        ],
+        input="q\n",
+    )
+
+    assert result.exit_code == 0
+    assert _SKIPPED_RE.search(result.stdout)
+
+
+def test_assemble_output_override_creates_missing_directories(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
+    result = runner.invoke(
+        cli,
+        [
+            *_base_argv(tmp_path),
+            "assemble",
+            "--role",
+            "code-review",
+            "--output",
+            "nested/out/role.md",
+        ],
+    )
+
+    assert result.exit_code == 0
+    output_file = tmp_path / "nested" / "out" / "role.md"
+    assert "`code-review`" in output_file.read_text(encoding="utf-8")
+
+
+def test_app_for_args_registers_only_invoked_command(runner: CliRunner, tmp_path: Path):
+    narrowed = app_for_args(["--project-root", str(tmp_path), "--no-color", "list"])
+
+    assert [info.name for info in narrowed.registered_commands] == ["list"]
+    result = runner.invoke(
+        get_command(narrowed),
+        ["--project-root", str(tmp_path), "--no-color", "list", "--scope", "builtin"],
+    )
+    assert result.exit_code == 0
+    assert "reviewer" in result.stdout
+
+
+def test_app_for_args_keeps_full_app_for_help_and_unknown_commands():
+    assert app_for_args(["--help"]) is app
+    assert app_for_args(["--no-color", "unknown"]) is app
+
+
+def test_list_builtin_scope_ignores_invalid_config(
+    runner: CliRunner, cli: click.Command, tmp_path: Path
+):
+    _write_config(tmp_path, "version = 'not-an-int'\n")
+
+    result = runner.invoke(
+        cli,
+        [
+            *_base_argv(tmp_path),
+            "list",
+            "--scope",
+            "builtin",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "reviewer" in result.stdout
+
+
+def test_review_accept_all_writes_every_target(
+    runner: CliRunner, cli: click.Command, tmp_path: Path, review_roles: Path
+):
+    role_files = [
+        review_roles / f"{slug}.md" for slug in ("code-review", "project-audit")
+    ]
+    result = runner.invoke(
+        cli,
+        [
+            *_base_argv(tmp_path),
+            "review",
+            "--target-sub-role",
+            "code-review",
+            "--target-sub-role",
+            "project-audit",
+            "--use-stub",
+        ],
+        input="a\n",
+    )
+
+    assert result.exit_code == 0
+    assert "files written: 2" in result.stdout
+    for role_file in role_files:
+        assert "acceptance-criteria checks" in role_file.read_text(encoding="utf-8")
+
+
+def test_review_changes_file_normalizes_crlf_role_file(
+    runner: CliRunner,
+    cli: click.Command,
+    tmp_path: Path,
+    write_role_file: WriteRoleFile,
+):
+    role_file = write_role_file(
+        _role_root(tmp_path),
         RoleKind.SUB_ROLE,
         "code-review",
         "# Code Review\n\n## Evaluation Areas\n- existing item",
     )
+    role_file.write_bytes(role_file.read_bytes().replace(b"\n", b"\r\n"))
+    changes_file = tmp_path / "changes.toml"
+    changes_file.write_bytes(
+        b'[[changes]]\ntarget_kind = "sub-role"\ntarget_slug = "code-review"\n'
+        b'op = "add"\nanchor = "## Evaluation Areas"\ntext = "- extra check"\n'
+    )
+
     result = runner.invoke(
-        app,
+        cli,
         [
-            "--project-root",
-            str(tmp_path),
-            "--user-home",
-            str(tmp_path / "home"),
-            "--no-color",
+            *_base_argv(tmp_path),
             "review",
             "--target-sub-role",
             "code-review",
-            "--use-stub",
+            "--changes-file",
+            str(changes_file),
         ],
-        input="q\n",
+        input="y\n",
     )
 
     assert result.exit_code == 0
-    assert re.search(r"skipped: [1-9]", result.stdout)
+    updated = role_file.read_bytes()
+    assert b"\r" not in updated
+    assert b"- extra check" in updated
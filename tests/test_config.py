@@ -1,27 +1,54 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from roly.config import load_config, write_config
+from roly.config import load_config, load_config_cached, write_config
 from roly.errors import ConfigError
 from roly.models import RolyConfig
 
+_CONFIG_HEADER = b"version = 1\n\n"
 
-def test_load_config_supports_new_roles_list_and_setup(tmp_path: Path):
-    config_file = tmp_path / "roly.config"
-    config_file.write_text(
-        """version = 1
-
-[setup]
+_CONFIG_ROLES_AND_SETUP = (
+    _CONFIG_HEADER
+    + b"""[setup]
 agent = "none"
 skill_dir = "roly_review_skill.md"
 
 [[user_roles]]
 name = "reviewer-default"
 roles = ["code-review", "project-audit"]
-""",
-        encoding="utf-8",
-    )
+"""
+)
+
+_CONFIG_LEGACY_ROLES = (
+    _CONFIG_HEADER
+    + b"""[[user_roles]]
+name = "legacy"
+top_level_role = "reviewer"
+sub_roles = ["code-review"]
+"""
+)
+
+_CONFIG_INVALID_AGENT = (
+    _CONFIG_HEADER
+    + b"""[setup]
+agent = "unknown"
+"""
+)
+
+_CONFIG_MISSING_ROLES = (
+    _CONFIG_HEADER
+    + b"""[[user_roles]]
+name = "invalid"
+sub_roles = ["code-review"]
+"""
+)
+
+
+def test_load_config_supports_new_roles_list_and_setup(tmp_path: Path):
+    config_file = tmp_path / "roly.config"
+    config_file.write_bytes(_CONFIG_ROLES_AND_SETUP)
 
     config = load_config(config_file)
 
@@ -32,16 +59,7 @@ roles = ["code-review", "project-audit"]
 
 def test_load_config_legacy_top_level_and_sub_roles_still_work(tmp_path: Path):
     config_file = tmp_path / "roly.config"
-    config_file.write_text(
-        """version = 1
-
-[[user_roles]]
-name = "legacy"
-top_level_role = "reviewer"
-sub_roles = ["code-review"]
-""",
-        encoding="utf-8",
-    )
+    config_file.write_bytes(_CONFIG_LEGACY_ROLES)
 
     config = load_config(config_file)
 
@@ -50,14 +68,7 @@ sub_roles = ["code-review"]
 
 def test_load_config_rejects_invalid_setup_agent(tmp_path: Path):
     config_file = tmp_path / "roly.config"
-    config_file.write_text(
-        """version = 1
-
-[setup]
-agent = "unknown"
-""",
-        encoding="utf-8",
-    )
+    config_file.write_bytes(_CONFIG_INVALID_AGENT)
 
     with pytest.raises(ConfigError):
         load_config(config_file)
@@ -65,15 +76,7 @@ agent = "unknown"
 
 def test_load_config_requires_roles_or_legacy_top_level(tmp_path: Path):
     config_file = tmp_path / "roly.config"
-    config_file.write_text(
-        """version = 1
-
-[[user_roles]]
-name = "invalid"
-sub_roles = ["code-review"]
-""",
-        encoding="utf-8",
-    )
+    config_file.write_bytes(_CONFIG_MISSING_ROLES)
 
     with pytest.raises(ConfigError):
         load_config(config_file)
@@ -91,3 +94,31 @@ def test_write_config_persists_setup_defaults(tmp_path: Path):
 
     assert loaded.setup.agent == "codex"
     assert loaded.setup.codex_dir == str(tmp_path / "codex")
+
+
+def test_load_config_cached_reuses_parse_until_file_changes(tmp_path: Path):
+    config_file = tmp_path / "roly.config"
+    config_file.write_bytes(_CONFIG_HEADER + b'[setup]\nagent = "none"\n')
+    os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+
+    first = load_config_cached(config_file)
+    assert load_config_cached(config_file) is first
+
+    updated = RolyConfig(version=1)
+    updated.setup.agent = "codex"
+    write_config(config_file, updated)
+
+    assert load_config_cached(config_file).setup.agent == "codex"
+
+
+def test_load_config_cached_skips_files_that_may_still_be_changing(tmp_path: Path):
+    config_file = tmp_path / "roly.config"
+    config_file.write_bytes(_CONFIG_HEADER + b'[setup]\nagent = "none"\n')
+    stat = config_file.stat()
+    load_config_cached(config_file)
+
+    config_file.write_bytes(_CONFIG_HEADER + b'[setup]\nagent = "cdex"\n')
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with pytest.raises(ConfigError):
+        load_config_cached(config_file)
@@ -1,23 +1,67 @@
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
 from roly.context import resolve_user_home
 
+SetRolyHome = Callable[[Path | None], None]
+
+
+@pytest.fixture
+def set_roly_home(monkeypatch: pytest.MonkeyPatch) -> SetRolyHome:
+    def _set(value: Path | None) -> None:
+        if value is None:
+            monkeypatch.delenv("ROLY_HOME", raising=False)
+        else:
+            monkeypatch.setenv("ROLY_HOME", str(value))
+
+    return _set
 
-def test_resolve_user_home_prefers_explicit_path(monkeypatch, tmp_path: Path):
-    monkeypatch.setenv("ROLY_HOME", str(tmp_path / "env-home"))
+
+def test_resolve_user_home_prefers_explicit_path(
+    set_roly_home: SetRolyHome, tmp_path: Path
+):
+    set_roly_home(tmp_path / "env-home")
     explicit = tmp_path / "explicit-home"
 
     assert resolve_user_home(explicit) == explicit.resolve()
 
 
-def test_resolve_user_home_uses_roly_home_env(monkeypatch, tmp_path: Path):
+def test_resolve_user_home_uses_roly_home_env(
+    set_roly_home: SetRolyHome, tmp_path: Path
+):
     env_home = tmp_path / "env-home"
-    monkeypatch.setenv("ROLY_HOME", str(env_home))
+    set_roly_home(env_home)
 
     assert resolve_user_home(None) == env_home.resolve()
 
 
-def test_resolve_user_home_defaults_to_dot_roly(monkeypatch):
-    monkeypatch.delenv("ROLY_HOME", raising=False)
+def test_resolve_user_home_defaults_to_dot_roly(set_roly_home: SetRolyHome):
+    set_roly_home(None)
 
     assert resolve_user_home(None) == Path("~/.roly").expanduser().resolve()
+
+
+def test_resolve_user_home_tracks_home_changes(
+    monkeypatch: pytest.MonkeyPatch, set_roly_home: SetRolyHome, tmp_path: Path
+):
+    set_roly_home(None)
+    monkeypatch.setenv("HOME", str(tmp_path / "first"))
+    first = resolve_user_home(None)
+    monkeypatch.setenv("HOME", str(tmp_path / "second"))
+
+    assert first == (tmp_path / "first" / ".roly").resolve()
+    assert resolve_user_home(None) == (tmp_path / "second" / ".roly").resolve()
+
+
+def test_resolve_user_home_works_in_a_deleted_working_directory(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    monkeypatch.chdir(gone)
+    gone.rmdir()
+    explicit = tmp_path / "explicit-home"
+
+    assert resolve_user_home(explicit) == explicit.resolve()
@@ -0,0 +1,47 @@
+from difflib import unified_diff
+
+import pytest
+
+from roly.diffing import build_unified_diff, classify_diff_line
+
+
+def test_build_unified_diff_matches_difflib_output():
+    before = "\n".join(f"line {index}" for index in range(20))
+    after = before.replace("line 3", "line three").replace("line 15\n", "")
+
+    expected = unified_diff(
+        before.splitlines(),
+        after.splitlines(),
+        fromfile="a",
+        tofile="b",
+        lineterm="",
+    )
+
+    assert list(
+        build_unified_diff(before=before, after=after, from_label="a", to_label="b")
+    ) == list(expected)
+
+
+def test_build_unified_diff_is_empty_for_identical_text():
+    diff = build_unified_diff(
+        before="same\n", after="same\n", from_label="a", to_label="b"
+    )
+
+    assert list(diff) == []
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("--- a", "meta"),
+        ("+++ b", "meta"),
+        ("@@ -1 +1 @@", "meta"),
+        ("+added", "add"),
+        ("-removed", "remove"),
+        ("@mention", "context"),
+        (" context", "context"),
+        ("", "context"),
+    ],
+)
+def test_classify_diff_line(line: str, expected: str):
+    assert classify_diff_line(line) == expected
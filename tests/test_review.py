@@ -6,6 +6,14 @@ from roly.errors import ReviewApplyError
 from roly.models import ChangeOp, ReviewChange, RoleKind
 from roly.review import apply_change, apply_change_with_result, load_review_changes
 
+_CHANGES_TOML = b"""[[changes]]
+target_kind = "sub-role"
+target_slug = "code-review"
+op = "add"
+anchor = "## Evaluation Areas"
+text = "- extra check"
+"""
+
 
 def test_apply_modify_change_updates_text():
     content = "alpha beta gamma"
@@ -25,16 +33,7 @@ def test_apply_modify_change_updates_text():
 
 def test_load_review_changes_from_file(tmp_path: Path):
     change_file = tmp_path / "changes.toml"
-    change_file.write_text(
-        """[[changes]]
-target_kind = "sub-role"
-target_slug = "code-review"
-op = "add"
-anchor = "## Evaluation Areas"
-text = "- extra check"
-""",
-        encoding="utf-8",
-    )
+    change_file.write_bytes(_CHANGES_TOML)
 
     changes = load_review_changes(change_file)
 
@@ -149,3 +148,27 @@ def test_apply_change_with_result_reports_anchor_not_found_noop():
 
     assert result.applied is False
     assert result.message == "no-op (anchor not found; text already present)"
+
+
+def test_apply_modify_with_identical_text_reports_match():
+    change = ReviewChange(
+        target_kind=RoleKind.SUB_ROLE,
+        target_slug="code-review",
+        op=ChangeOp.MODIFY,
+        old_text="beta",
+        new_text="beta",
+    )
+
+    assert apply_change("alpha beta", change) == ("alpha beta", True)
+    assert apply_change("alpha gamma", change) == ("alpha gamma", False)
+
+
+def test_apply_remove_with_empty_text_reports_match():
+    change = ReviewChange(
+        target_kind=RoleKind.SUB_ROLE,
+        target_slug="code-review",
+        op=ChangeOp.REMOVE,
+        text="",
+    )
+
+    assert apply_change("alpha beta", change) == ("alpha beta", True)
@@ -1,16 +1,18 @@
+import os
 from pathlib import Path
 
 import pytest
 
 from roly.errors import RoleParseError
 from roly.models import RoleKind, SectionType
-from roly.role_parser import parse_role_file
-
-
-def test_parse_role_file_success(tmp_path: Path):
-    role_file = tmp_path / "reviewer.md"
-    role_file.write_text(
-        """+++
+from roly.role_parser import (
+    clear_role_cache,
+    parse_role_file,
+    parse_role_file_cached,
+    parse_role_files,
+)
+
+_ROLE_VALID = b"""+++
 kind = "top-level"
 name = "Reviewer"
 slug = "reviewer"
@@ -27,9 +29,57 @@ item_contributions = ["bar"]
 +++
 
 # Body
-""",
-        encoding="utf-8",
-    )
+"""
+
+_ROLE_INVALID_KIND = b"""+++
+kind = "unsupported"
+name = "Invalid Kind"
+slug = "invalid-kind"
+version = "1.0.0"
++++
+
+# Body
+"""
+
+_ROLE_MISSING_CLOSE = b"""+++
+kind = "top-level"
+name = "Missing Close"
+slug = "missing-close"
+version = "1.0.0"
+
+# Body
+"""
+
+_ROLE_INVALID_SECTION = b"""+++
+kind = "top-level"
+name = "Invalid Section"
+slug = "invalid-section"
+version = "1.0.0"
+
+[output]
+
+[[output.sections]]
+key = "Summary"
+type = "unsupported"
++++
+
+# Body
+"""
+
+_ROLE_MISSING_DEPENDENCY = b"""+++
+kind = "sub-role"
+name = "Missing Dependency"
+slug = "missing-dependency"
+version = "1.0.0"
++++
+
+# Body
+"""
+
+
+def test_parse_role_file_success(tmp_path: Path):
+    role_file = tmp_path / "reviewer.md"
+    role_file.write_bytes(_ROLE_VALID)
 
     parsed = parse_role_file(role_file, "project")
 
@@ -52,18 +102,7 @@ def test_parse_role_file_requires_front_matter(tmp_path: Path):
 
 def test_parse_role_file_errors_for_invalid_kind(tmp_path: Path):
     role_file = tmp_path / "invalid-kind.md"
-    role_file.write_text(
-        """+++
-kind = "unsupported"
-name = "Invalid Kind"
-slug = "invalid-kind"
-version = "1.0.0"
-+++
-
-# Body
-""",
-        encoding="utf-8",
-    )
+    role_file.write_bytes(_ROLE_INVALID_KIND)
 
     with pytest.raises(RoleParseError):
         parse_role_file(role_file, "project")
@@ -71,17 +110,7 @@ version = "1.0.0"
 
 def test_parse_role_file_requires_closing_front_matter_delimiter(tmp_path: Path):
     role_file = tmp_path / "missing-close.md"
-    role_file.write_text(
-        """+++
-kind = "top-level"
-name = "Missing Close"
-slug = "missing-close"
-version = "1.0.0"
-
-# Body
-""",
-        encoding="utf-8",
-    )
+    role_file.write_bytes(_ROLE_MISSING_CLOSE)
 
     with pytest.raises(RoleParseError):
         parse_role_file(role_file, "project")
@@ -89,43 +118,76 @@ version = "1.0.0"
 
 def test_parse_role_file_errors_for_invalid_section_type(tmp_path: Path):
     role_file = tmp_path / "invalid-section.md"
-    role_file.write_text(
-        """+++
-kind = "top-level"
-name = "Invalid Section"
-slug = "invalid-section"
-version = "1.0.0"
+    role_file.write_bytes(_ROLE_INVALID_SECTION)
 
-[output]
+    with pytest.raises(RoleParseError):
+        parse_role_file(role_file, "project")
 
-[[output.sections]]
-key = "Summary"
-type = "unsupported"
-+++
 
-# Body
-""",
-        encoding="utf-8",
-    )
+def test_parse_role_file_requires_sub_role_dependency_field(tmp_path: Path):
+    role_file = tmp_path / "sub-role-missing-dependency.md"
+    role_file.write_bytes(_ROLE_MISSING_DEPENDENCY)
 
     with pytest.raises(RoleParseError):
         parse_role_file(role_file, "project")
 
 
-def test_parse_role_file_requires_sub_role_dependency_field(tmp_path: Path):
-    role_file = tmp_path / "sub-role-missing-dependency.md"
-    role_file.write_text(
-        """+++
-kind = "sub-role"
-name = "Missing Dependency"
-slug = "missing-dependency"
-version = "1.0.0"
-+++
+def test_parse_role_file_normalizes_crlf_newlines(tmp_path: Path):
+    role_file = tmp_path / "reviewer.md"
+    role_file.write_bytes(
+        b'+++\r\nkind = "top-level"\r\nname = "Reviewer"\r\nslug = "reviewer"\r\n'
+        b'version = "1.0.0"\r\n+++\r\n\r\n# Body\r\nline\r\n'
+    )
 
-# Body
-""",
+    parsed = parse_role_file(role_file, "project")
+
+    assert parsed.body == "# Body\nline\n"
+
+
+def test_parse_role_file_cached_reuses_settled_files(tmp_path: Path):
+    clear_role_cache()
+    role_file = tmp_path / "reviewer.md"
+    role_file.write_text(
+        '+++\nkind = "top-level"\nname = "Reviewer"\nslug = "reviewer"\n'
+        'version = "1.0.0"\n+++\n',
         encoding="utf-8",
     )
+    os.utime(role_file, ns=(1_000_000_000, 1_000_000_000))
 
-    with pytest.raises(RoleParseError):
-        parse_role_file(role_file, "project")
+    first = parse_role_file_cached(role_file, "project")
+    assert parse_role_file_cached(role_file, "project") is first
+
+    role_file.write_text(
+        role_file.read_text(encoding="utf-8").replace("1.0.0", "2.0.0"),
+        encoding="utf-8",
+    )
+    os.utime(role_file, ns=(2_000_000_000, 2_000_000_000))
+
+    assert parse_role_file_cached(role_file, "project").version == "2.0.0"
+
+
+def test_parse_role_files_keeps_input_order_across_cache_hits_and_misses(
+    tmp_path: Path,
+):
+    clear_role_cache()
+    entries = []
+    for index in range(6):
+        path = tmp_path / f"role-{index}.md"
+        path.write_text(
+            f'+++\nkind = "top-level"\nname = "Role {index}"\nslug = "role-{index}"\n'
+            'version = "1.0.0"\n+++\n',
+            encoding="utf-8",
+        )
+        entries.append((path, "project" if index % 2 else "user"))
+    cached = {}
+    for index in (1, 4):
+        path, scope = entries[index]
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        cached[index] = parse_role_file_cached(path, scope)
+
+    documents = parse_role_files(entries)
+
+    assert [(doc.slug, doc.source_scope) for doc in documents] == [
+        (f"role-{index}", scope) for index, (_, scope) in enumerate(entries)
+    ]
+    assert all(documents[index] is doc for index, doc in cached.items())
@@ -1,52 +1,31 @@
+import os
 from pathlib import Path
 
+from conftest import WriteRoleFile
+
 from roly.models import RoleKind
 from roly.paths import kind_dir
 from roly.role_store import list_roles, resolve_role
 
 
-def _write_role_file(root: Path, kind: RoleKind, slug: str, body: str) -> Path:
-    dependency_line = (
-        'depends_on_top_level = "reviewer"\n' if kind is RoleKind.SUB_ROLE else ""
-    )
-    path = kind_dir(root, kind) / f"{slug}.md"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        """+++
-kind = "{kind}"
-name = "{name}"
-slug = "{slug}"
-version = "1.0.0"
-{dependency_line}
-+++
-
-{body}
-""".format(
-            kind=kind.value,
-            name=slug.replace("-", " ").title(),
-            slug=slug,
-            dependency_line=dependency_line,
-            body=body,
-        ),
-        encoding="utf-8",
-    )
-    return path
-
-
-def test_resolve_role_prefers_project_over_user_and_builtin(tmp_path: Path):
+def test_resolve_role_prefers_project_over_user_and_builtin(
+    tmp_path: Path, write_role_file: WriteRoleFile
+):
     project_root = tmp_path
     user_home = tmp_path / "home"
-    _write_role_file(
+    write_role_file(
         user_home / "roles",
         RoleKind.TOP_LEVEL,
         "reviewer",
         "user-level reviewer body",
+        with_output=False,
     )
-    _write_role_file(
+    write_role_file(
         project_root / ".roly" / "roles",
         RoleKind.TOP_LEVEL,
         "reviewer",
         "project-level reviewer body",
+        with_output=False,
     )
 
     role = resolve_role(
@@ -61,14 +40,17 @@ def test_resolve_role_prefers_project_over_user_and_builtin(tmp_path: Path):
     assert "project-level reviewer body" in role.body
 
 
-def test_resolve_role_prefers_user_when_project_missing(tmp_path: Path):
+def test_resolve_role_prefers_user_when_project_missing(
+    tmp_path: Path, write_role_file: WriteRoleFile
+):
     project_root = tmp_path
     user_home = tmp_path / "home"
-    _write_role_file(
+    write_role_file(
         user_home / "roles",
         RoleKind.SUB_ROLE,
         "code-review",
         "user-level code-review body",
+        with_output=False,
     )
 
     role = resolve_role(
@@ -96,20 +78,24 @@ def test_resolve_role_falls_back_to_builtin(tmp_path: Path):
     assert role.slug == "reviewer"
 
 
-def test_list_roles_honors_scope_and_kind_filters(tmp_path: Path):
+def test_list_roles_honors_scope_and_kind_filters(
+    tmp_path: Path, write_role_file: WriteRoleFile
+):
     project_root = tmp_path
     user_home = tmp_path / "home"
-    _write_role_file(
+    write_role_file(
         project_root / ".roly" / "roles",
         RoleKind.SUB_ROLE,
         "project-only",
         "project body",
+        with_output=False,
     )
-    _write_role_file(
+    write_role_file(
         user_home / "roles",
         RoleKind.TOP_LEVEL,
         "user-only-top",
         "user body",
+        with_output=False,
     )
 
     project_sub_roles = list_roles(
@@ -133,3 +119,59 @@ def test_list_roles_honors_scope_and_kind_filters(tmp_path: Path):
     assert {(role.source_scope, role.slug) for role in user_top_roles} == {
         ("user", "user-only-top")
     }
+
+
+def test_list_roles_sees_files_added_to_a_cached_listing(
+    tmp_path: Path, write_role_file: WriteRoleFile
+):
+    roles_root = tmp_path / ".roly" / "roles"
+    write_role_file(roles_root, RoleKind.TOP_LEVEL, "first", "First", with_output=False)
+    top_level_dir = kind_dir(roles_root, RoleKind.TOP_LEVEL)
+    os.utime(top_level_dir, ns=(1_000_000_000, 1_000_000_000))
+
+    def listed_slugs() -> list[str]:
+        roles = list_roles(
+            project_root=tmp_path,
+            user_home=tmp_path / "home",
+            project_roles_dir=".roly/roles",
+            scope_filter="project",
+            kind_filter="top-level",
+        )
+        return [role.slug for role in roles]
+
+    assert listed_slugs() == ["first"]
+    write_role_file(
+        roles_root, RoleKind.TOP_LEVEL, "second", "Second", with_output=False
+    )
+
+    assert listed_slugs() == ["first", "second"]
+
+
+def test_list_roles_reuses_parses_of_unchanged_files(
+    tmp_path: Path, write_role_file: WriteRoleFile
+):
+    roles_root = tmp_path / ".roly" / "roles"
+    settled = write_role_file(
+        roles_root, RoleKind.TOP_LEVEL, "settled", "Body", with_output=False
+    )
+    os.utime(settled, ns=(1_000_000_000, 1_000_000_000))
+
+    def list_project_roles() -> list:
+        return list_roles(
+            project_root=tmp_path,
+            user_home=tmp_path / "home",
+            project_roles_dir=".roly/roles",
+            scope_filter="project",
+            kind_filter="all",
+        )
+
+    first = list_project_roles()
+    edited = write_role_file(
+        roles_root, RoleKind.TOP_LEVEL, "settled", "Edited", with_output=False
+    )
+    os.utime(edited, ns=(2_000_000_000, 2_000_000_000))
+    second = list_project_roles()
+
+    assert list_project_roles()[0] is second[0]
+    assert first[0].body.strip() == "Body"
+    assert second[0].body.strip() == "Edited"
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from roly.setup import needs_update, render_none_prompt, resolve_codex_skills_dir
+
+
+def test_needs_update_finds_metadata_past_the_file_head(tmp_path: Path):
+    content = render_none_prompt()
+    destination = tmp_path / "skill.md"
+    destination.write_text("x" * 8192 + "\n" + content, encoding="utf-8")
+
+    assert not needs_update(destination, content, force=False)
+
+
+def test_resolve_codex_skills_dir_works_in_a_deleted_working_directory(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    monkeypatch.chdir(gone)
+    gone.rmdir()
+    monkeypatch.setenv("CODEX_HOME", str(tmp_path / "codex"))
+
+    assert resolve_codex_skills_dir(None) == (tmp_path / "codex").resolve() / "skills"